@@ -45,7 +45,16 @@ def build_async_database_url() -> str:
 DATABASE_URL = build_async_database_url()
 
 try:
-    engine = create_async_engine(DATABASE_URL)
+    # One engine per process; the pool is sized for concurrent async requests
+    # that each issue several queries, and LIFO keeps the warm connections in use.
+    engine = create_async_engine(
+        DATABASE_URL,
+        pool_size=int(os.environ.get("DB_POOL_SIZE", 20)),
+        max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", 20)),
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+    )
     async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 except Exception as e:
     raise RuntimeError(
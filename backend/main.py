@@ -4,7 +4,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .routes import router
-from .database import create_db_and_tables
+from .database import create_db_and_tables, engine
 from .auth import fastapi_users, auth_backend
 from .auth_schemas import UserRead, UserCreate, UserUpdate
 from .team_routes import router as team_router
@@ -26,6 +26,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if os.environ.get("ENV") == "development":
+    from .query_monitor import QueryMonitorMiddleware, install_query_monitor
+
+    install_query_monitor(engine)
+    app.add_middleware(QueryMonitorMiddleware)
+
 app.include_router(
     fastapi_users.get_auth_router(auth_backend),
     prefix="/auth/jwt",
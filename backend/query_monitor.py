@@ -0,0 +1,49 @@
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger("backend.nplusone")
+
+_request_statements: ContextVar[Optional[List[str]]] = ContextVar("request_statements", default=None)
+
+
+def install_query_monitor(engine: AsyncEngine) -> None:
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements = _request_statements.get()
+        if statements is not None:
+            statements.append(statement)
+
+
+class QueryMonitorMiddleware:
+    """Development-only ASGI middleware that flags repeated SQL per request.
+
+    The same statement executed many times within one request is the
+    signature of an n+1 query (e.g. a per-team SELECT inside a loop).
+    """
+
+    def __init__(self, app, threshold: int = 5):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        statements: List[str] = []
+        token = _request_statements.set(statements)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_statements.reset(token)
+            for statement, count in Counter(statements).items():
+                if count >= self.threshold:
+                    logger.warning(
+                        "Possible n+1 query on %s %s: statement executed %d times: %s",
+                        scope["method"], scope["path"], count, " ".join(statement.split())
+                    )
@@ -1,10 +1,14 @@
+import hashlib
+import json
 import uuid
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy import select, and_, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from .database import get_async_session
 from .models import Team, User, team_members, TeamRole
@@ -14,76 +18,121 @@ from .auth_schemas import TeamCreate, TeamUpdate, TeamRead, TeamMemberAdd, TeamM
 router = APIRouter(prefix="/teams", tags=["teams"])
 
 
+def _utcnow() -> datetime:
+    # team_members.joined_at is a naive UTC column, so drop tzinfo after reading the clock.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 async def get_team_with_permission(
     team_id: uuid.UUID,
     session: AsyncSession,
     user: User,
     required_roles: Optional[List[TeamRole]] = None
 ) -> Team:
-    result = await session.execute(select(Team).where(Team.id == team_id))
-    team = result.scalar_one_or_none()
-    
-    if not team:
-        raise HTTPException(status_code=404, detail="Team not found")
-    
-    membership = await session.execute(
-        select(team_members).where(
+    # Team row and the caller's membership come back in one query; the
+    # selectin relationships on Team are deferred until actually accessed.
+    result = await session.execute(
+        select(Team, team_members.c.role)
+        .outerjoin(
+            team_members,
             and_(
-                team_members.c.team_id == team_id,
+                team_members.c.team_id == Team.id,
                 team_members.c.user_id == user.id
             )
         )
+        .where(Team.id == team_id)
+        .options(lazyload(Team.members), lazyload(Team.projects))
     )
-    member_row = membership.first()
+    row = result.first()
+    
+    if not row:
+        raise HTTPException(status_code=404, detail="Team not found")
+    
+    team, member_role = row
     
-    if not member_row and team.owner_id != user.id:
+    if member_role is None and team.owner_id != user.id:
         raise HTTPException(status_code=403, detail="Not a member of this team")
     
     if required_roles:
-        user_role = TeamRole.OWNER if team.owner_id == user.id else (member_row.role if member_row else None)
+        user_role = TeamRole.OWNER if team.owner_id == user.id else member_role
         if user_role not in required_roles:
             raise HTTPException(status_code=403, detail="Insufficient permissions")
     
     return team
 
 
+async def get_team_members(
+    session: AsyncSession,
+    team_ids: List[uuid.UUID]
+) -> Dict[uuid.UUID, List[TeamMemberRead]]:
+    members: Dict[uuid.UUID, List[TeamMemberRead]] = {team_id: [] for team_id in team_ids}
+    if not team_ids:
+        return members
+    
+    # Only the user columns needed for the response are selected, so the
+    # selectin relationships on User are never triggered.
+    result = await session.execute(
+        select(
+            team_members.c.team_id,
+            User.id,
+            User.email,
+            User.display_name,
+            team_members.c.role,
+            team_members.c.joined_at
+        )
+        .join(team_members, User.id == team_members.c.user_id)
+        .where(team_members.c.team_id.in_(team_ids))
+    )
+    for row in result:
+        members[row.team_id].append(TeamMemberRead(
+            id=row.id,
+            email=row.email,
+            display_name=row.display_name,
+            role=row.role,
+            joined_at=row.joined_at
+        ))
+    return members
+
+
+def with_etag(request: Request, response: Response, payload):
+    # Weak ETag over the serialized payload: unchanged polls get a 304 with no body.
+    body = json.dumps(jsonable_encoder(payload), sort_keys=True, separators=(",", ":"))
+    etag = f'W/"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=5"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return payload
+
+
+def team_to_read(team: Team, members: List[TeamMemberRead]) -> TeamRead:
+    return TeamRead(
+        id=team.id,
+        name=team.name,
+        description=team.description,
+        owner_id=team.owner_id,
+        created_at=team.created_at,
+        members=members
+    )
+
+
 @router.get("", response_model=List[TeamRead])
 async def list_teams(
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user)
 ):
     result = await session.execute(
-        select(Team).join(team_members, Team.id == team_members.c.team_id).where(team_members.c.user_id == user.id)
+        select(Team)
+        .join(team_members, Team.id == team_members.c.team_id)
+        .where(team_members.c.user_id == user.id)
+        .options(lazyload(Team.members), lazyload(Team.projects))
     )
     teams = list(result.scalars().all())
     
-    teams_with_members = []
-    for team in teams:
-        members_result = await session.execute(
-            select(User, team_members.c.role, team_members.c.joined_at)
-            .join(team_members, User.id == team_members.c.user_id)
-            .where(team_members.c.team_id == team.id)
-        )
-        members = [
-            TeamMemberRead(
-                id=row.User.id,
-                email=row.User.email,
-                display_name=row.User.display_name,
-                role=row.role,
-                joined_at=row.joined_at
-            )
-            for row in members_result
-        ]
-        teams_with_members.append(TeamRead(
-            id=team.id,
-            name=team.name,
-            description=team.description,
-            owner_id=team.owner_id,
-            created_at=team.created_at,
-            members=members
-        ))
-    
-    return teams_with_members
+    members = await get_team_members(session, [team.id for team in teams])
+    return with_etag(request, response, [team_to_read(team, members[team.id]) for team in teams])
 
 
 @router.post("", response_model=TeamRead, status_code=status.HTTP_201_CREATED)
@@ -100,7 +149,7 @@ async def create_team(
     session.add(team)
     await session.flush()
     
-    joined_at = datetime.utcnow()
+    joined_at = _utcnow()
     await session.execute(
         team_members.insert().values(
             team_id=team.id,
@@ -113,54 +162,27 @@ async def create_team(
     await session.commit()
     await session.refresh(team)
     
-    return TeamRead(
-        id=team.id,
-        name=team.name,
-        description=team.description,
-        owner_id=team.owner_id,
-        created_at=team.created_at,
-        members=[TeamMemberRead(
-            id=user.id,
-            email=user.email,
-            display_name=user.display_name,
-            role=TeamRole.OWNER,
-            joined_at=joined_at
-        )]
-    )
+    return team_to_read(team, [TeamMemberRead(
+        id=user.id,
+        email=user.email,
+        display_name=user.display_name,
+        role=TeamRole.OWNER,
+        joined_at=joined_at
+    )])
 
 
 @router.get("/{team_id}", response_model=TeamRead)
 async def get_team(
     team_id: uuid.UUID,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user)
 ):
     team = await get_team_with_permission(team_id, session, user)
     
-    members_result = await session.execute(
-        select(User, team_members.c.role, team_members.c.joined_at)
-        .join(team_members, User.id == team_members.c.user_id)
-        .where(team_members.c.team_id == team_id)
-    )
-    
-    members = []
-    for row in members_result:
-        members.append(TeamMemberRead(
-            id=row.User.id,
-            email=row.User.email,
-            display_name=row.User.display_name,
-            role=row.role,
-            joined_at=row.joined_at
-        ))
-    
-    return TeamRead(
-        id=team.id,
-        name=team.name,
-        description=team.description,
-        owner_id=team.owner_id,
-        created_at=team.created_at,
-        members=members
-    )
+    members = await get_team_members(session, [team_id])
+    return with_etag(request, response, team_to_read(team, members[team_id]))
 
 
 @router.patch("/{team_id}", response_model=TeamRead)
@@ -181,32 +203,9 @@ async def update_team(
         team.description = data.description
     
     await session.commit()
-    await session.refresh(team)
-    
-    members_result = await session.execute(
-        select(User, team_members.c.role, team_members.c.joined_at)
-        .join(team_members, User.id == team_members.c.user_id)
-        .where(team_members.c.team_id == team_id)
-    )
-    members = [
-        TeamMemberRead(
-            id=row.User.id,
-            email=row.User.email,
-            display_name=row.User.display_name,
-            role=row.role,
-            joined_at=row.joined_at
-        )
-        for row in members_result
-    ]
     
-    return TeamRead(
-        id=team.id,
-        name=team.name,
-        description=team.description,
-        owner_id=team.owner_id,
-        created_at=team.created_at,
-        members=members
-    )
+    members = await get_team_members(session, [team_id])
+    return team_to_read(team, members[team_id])
 
 
 @router.delete("/{team_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -239,29 +238,29 @@ async def add_team_member(
     if data.role == TeamRole.ADMIN and not is_owner:
         raise HTTPException(status_code=403, detail="Only the owner can assign admin role")
     
-    result = await session.execute(select(User).where(User.email == data.email))
-    new_member = result.scalar_one_or_none()
+    new_member = await session.scalar(select(User).where(User.email == data.email))
     
     if not new_member:
         raise HTTPException(status_code=404, detail="User not found with that email")
     
-    existing = await session.execute(
-        select(team_members).where(
+    existing_id = await session.scalar(
+        select(team_members.c.id).where(
             and_(
                 team_members.c.team_id == team_id,
                 team_members.c.user_id == new_member.id
             )
         )
     )
-    if existing.first():
+    if existing_id is not None:
         raise HTTPException(status_code=400, detail="User is already a member")
     
+    joined_at = _utcnow()
     await session.execute(
         team_members.insert().values(
             team_id=team_id,
             user_id=new_member.id,
             role=data.role,
-            joined_at=datetime.utcnow()
+            joined_at=joined_at
         )
     )
     await session.commit()
@@ -271,7 +270,7 @@ async def add_team_member(
         email=new_member.email,
         display_name=new_member.display_name,
         role=data.role,
-        joined_at=datetime.utcnow()
+        joined_at=joined_at
     )
 
 
@@ -295,17 +294,16 @@ async def update_member_role(
     if data.role == TeamRole.ADMIN and not is_owner:
         raise HTTPException(status_code=403, detail="Only the owner can assign admin role")
     
-    result = await session.execute(
-        select(team_members).where(
+    joined_at = await session.scalar(
+        select(team_members.c.joined_at).where(
             and_(
                 team_members.c.team_id == team_id,
                 team_members.c.user_id == member_id
             )
         )
     )
-    member_row = result.first()
     
-    if not member_row:
+    if joined_at is None:
         raise HTTPException(status_code=404, detail="Member not found")
     
     upd_stmt = update(team_members).where(
@@ -325,7 +323,7 @@ async def update_member_role(
         email=member_user.email,
         display_name=member_user.display_name,
         role=data.role,
-        joined_at=member_row.joined_at
+        joined_at=joined_at
     )
 
 
@@ -353,7 +351,7 @@ async def remove_team_member(
             team_members.c.user_id == member_id
         )
     )
-    result = await session.execute(del_stmt)
+    await session.execute(del_stmt)
     
     await session.commit()
 
@@ -364,13 +362,12 @@ async def leave_team(
     session: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user)
 ):
-    result = await session.execute(select(Team).where(Team.id == team_id))
-    team = result.scalar_one_or_none()
+    owner_id = await session.scalar(select(Team.owner_id).where(Team.id == team_id))
     
-    if not team:
+    if owner_id is None:
         raise HTTPException(status_code=404, detail="Team not found")
     
-    if team.owner_id == user.id:
+    if owner_id == user.id:
         raise HTTPException(status_code=400, detail="Owner cannot leave the team. Transfer ownership or delete the team.")
     
     del_stmt = delete(team_members).where(
@@ -3,23 +3,82 @@ from __future__ import annotations
 import argparse
 import logging
 import random
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Optional
 
 import httpx
 
 from experiment_tracker_sdk import ExperimentClient
 from experiment_tracker_sdk.config import load_config
-from experiment_tracker_sdk.models import ExperimentStatus
+from experiment_tracker_sdk.models import ExperimentStatus, ScalarLogRequest
 
 logger = logging.getLogger("training_example")
 
 
+class ScalarBuffer:
+    """Accumulate per-step scalars and send them as batch requests.
+
+    Rows are flushed once ``flush_every`` steps are buffered or
+    ``flush_interval`` seconds after the first buffered row, whichever
+    comes first.
+    """
+
+    def __init__(
+        self,
+        client: ExperimentClient,
+        experiment_id: str,
+        flush_every: int = 10,
+        flush_interval: float = 5.0,
+    ):
+        self._client = client
+        self._experiment_id = experiment_id
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+        self._rows: list[ScalarLogRequest] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def add(
+        self,
+        scalars: dict[str, float],
+        step: int,
+        tags: Optional[list[str]] = None,
+    ) -> None:
+        with self._lock:
+            self._rows.append(ScalarLogRequest(scalars=scalars, step=step, tags=tags))
+            if len(self._rows) < self._flush_every:
+                if self._timer is None:
+                    self._timer = threading.Timer(self._flush_interval, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            rows = self._drain()
+        self._client.log_scalars_batch(self._experiment_id, rows)
+
+    def flush(self) -> None:
+        with self._lock:
+            rows = self._drain()
+        self._client.log_scalars_batch(self._experiment_id, rows)
+
+    def _drain(self) -> list[ScalarLogRequest]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        rows, self._rows = self._rows, []
+        return rows
+
+
 def _get_api_client(base_url: str, api_token: str) -> httpx.Client:
+    # One pooled client is shared by the helpers below and the SDK client so
+    # every request reuses the same keep-alive connections.
     return httpx.Client(
         base_url=base_url.rstrip("/"),
         headers={"Authorization": f"Bearer {api_token}"},
         timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+        transport=httpx.HTTPTransport(retries=1),
     )
 
 
@@ -81,6 +140,12 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--project-name", default="SDK Training")
     parser.add_argument("--experiment-name", default="SDK Training Run")
     parser.add_argument("--team-name", default=None)
+    parser.add_argument(
+        "--flush-every",
+        type=int,
+        default=10,
+        help="Number of steps to buffer before sending scalars.",
+    )
     return parser.parse_args()
 
 
@@ -124,7 +189,7 @@ def main() -> None:
             logger.info("project_found", extra={"project_id": project["id"]})
 
         sdk_client = ExperimentClient(
-            base_url=config.base_url, api_token=config.api_token
+            base_url=config.base_url, api_token=config.api_token, client=api_client
         )
         experiment = sdk_client.create_experiment(
             project_id=str(project["id"]),
@@ -147,6 +212,14 @@ def main() -> None:
         steps = 12
         step_seconds = duration_seconds / steps
         start_time = time.time()
+        # The progress update for a step runs on a single worker thread while
+        # the next step is already training, so network latency overlaps with
+        # it and updates still reach the server in order.
+        update_executor = ThreadPoolExecutor(max_workers=1)
+        pending_update: Optional[Future[Any]] = None
+        scalar_buffer = ScalarBuffer(
+            sdk_client, experiment.id, flush_every=args.flush_every
+        )
 
         for step in range(1, steps + 1):
             time.sleep(step_seconds)
@@ -157,8 +230,7 @@ def main() -> None:
             accuracy = random.uniform(0.6, 0.99)
             loss = random.uniform(0.1, 1.2)
             bce_loss = random.uniform(0.05, 0.9)
-            sdk_client.log_scalars(
-                experiment_id=experiment.id,
+            scalar_buffer.add(
                 scalars={
                     "accuracy": accuracy,
                     "loss": loss,
@@ -167,7 +239,10 @@ def main() -> None:
                 step=step,
                 tags=["training"],
             )
-            sdk_client.update_experiment(
+            if pending_update is not None:
+                pending_update.result()
+            pending_update = update_executor.submit(
+                sdk_client.update_experiment,
                 experiment_id=experiment.id,
                 status=ExperimentStatus.RUNNING,
                 progress=progress,
@@ -184,6 +259,11 @@ def main() -> None:
                 },
             )
 
+        if pending_update is not None:
+            pending_update.result()
+        update_executor.shutdown()
+        scalar_buffer.flush()
+
         final_accuracy = random.uniform(0.7, 0.99)
         final_loss = random.uniform(0.1, 0.6)
         sdk_client.log_metric(
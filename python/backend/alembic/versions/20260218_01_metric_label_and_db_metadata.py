@@ -13,6 +13,8 @@ from typing import Union
 from alembic import op
 import sqlalchemy as sa
 
+from db.migration_utils import upsert_db_version
+
 # revision identifiers, used by Alembic.
 revision: str = "20260218_01"
 down_revision: Union[str, Sequence[str], None] = None
@@ -22,41 +24,23 @@ depends_on: Union[str, Sequence[str], None] = None
 DB_VERSION = "2026.02.18.01"
 
 
-def _upsert_db_version(version: str) -> None:
-    bind = op.get_bind()
-    dialect = bind.dialect.name
-
-    if dialect in {"postgresql", "sqlite"}:
-        bind.execute(
-            sa.text(
-                """
-                INSERT INTO db_metadata (id, version)
-                VALUES (1, :version)
-                ON CONFLICT (id) DO UPDATE SET version = EXCLUDED.version
-                """
-            ),
-            {"version": version},
-        )
-        return
-
-    result = bind.execute(
-        sa.text("UPDATE db_metadata SET version = :version WHERE id = 1"),
-        {"version": version},
-    )
-    if result.rowcount == 0:
-        bind.execute(
-            sa.text("INSERT INTO db_metadata (id, version) VALUES (1, :version)"),
-            {"version": version},
+def _inspect_schema() -> tuple[frozenset[str], frozenset[str]]:
+    """Return existing table names and ``metrics`` columns in one inspection."""
+    inspector = sa.inspect(op.get_bind())
+    table_names = frozenset(inspector.get_table_names())
+    metric_columns: frozenset[str] = frozenset()
+    if "metrics" in table_names:
+        metric_columns = frozenset(
+            column["name"] for column in inspector.get_columns("metrics")
         )
+    return table_names, metric_columns
 
 
 def upgrade() -> None:
     bind = op.get_bind()
-    inspector = sa.inspect(bind)
-    table_names = set(inspector.get_table_names())
+    table_names, metric_columns = _inspect_schema()
 
     if "metrics" in table_names:
-        metric_columns = {column["name"] for column in inspector.get_columns("metrics")}
         with op.batch_alter_table("metrics", schema=None) as batch_op:
             if "label" not in metric_columns:
                 batch_op.add_column(sa.Column("label", sa.String(length=100), nullable=True))
@@ -74,16 +58,13 @@ def upgrade() -> None:
             sa.PrimaryKeyConstraint("id"),
         )
 
-    _upsert_db_version(DB_VERSION)
+    upsert_db_version(bind, DB_VERSION)
 
 
 def downgrade() -> None:
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
-    table_names = set(inspector.get_table_names())
+    table_names, metric_columns = _inspect_schema()
 
     if "metrics" in table_names:
-        metric_columns = {column["name"] for column in inspector.get_columns("metrics")}
         with op.batch_alter_table("metrics", schema=None) as batch_op:
             if "direction" not in metric_columns:
                 batch_op.add_column(
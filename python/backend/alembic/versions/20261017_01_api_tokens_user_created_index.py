@@ -0,0 +1,41 @@
+"""add api_tokens (user_id, created_at) index
+
+Revision ID: 20261017_01
+Revises: dea9cb85cdf3
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+from db.migration_utils import upsert_db_version
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_01"
+down_revision = "dea9cb85cdf3"
+branch_labels = None
+depends_on = None
+
+PREVIOUS_DB_VERSION = "2026.02.19.01"
+DB_VERSION = "2026.10.17.01"
+
+
+def upgrade() -> None:
+    # token_hash already has a unique index; listing tokens per user did not.
+    op.create_index(
+        "ix_api_tokens_user_created",
+        "api_tokens",
+        ["user_id", "created_at"],
+        if_not_exists=True,
+    )
+
+    upsert_db_version(op.get_bind(), DB_VERSION)
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_api_tokens_user_created", table_name="api_tokens", if_exists=True
+    )
+    upsert_db_version(op.get_bind(), PREVIOUS_DB_VERSION)
@@ -0,0 +1,40 @@
+"""add experiments listing indexes
+
+Revision ID: 20261017_02
+Revises: 20261017_01
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+from db.migration_utils import upsert_db_version
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_02"
+down_revision = "20261017_01"
+branch_labels = None
+depends_on = None
+
+PREVIOUS_DB_VERSION = "2026.10.17.01"
+DB_VERSION = "2026.10.17.02"
+
+INDEXES = {
+    "ix_experiments_project_order": ["project_id", "order"],
+    "ix_experiments_started_by_created": ["started_by", "created_at"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES.items():
+        op.create_index(name, "experiments", columns, if_not_exists=True)
+
+    upsert_db_version(op.get_bind(), DB_VERSION)
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.drop_index(name, table_name="experiments", if_exists=True)
+    upsert_db_version(op.get_bind(), PREVIOUS_DB_VERSION)
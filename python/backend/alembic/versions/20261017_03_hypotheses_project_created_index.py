@@ -0,0 +1,41 @@
+"""add hypotheses (project_id, created_at) index
+
+Revision ID: 20261017_03
+Revises: 20261017_02
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+from db.migration_utils import upsert_db_version
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_03"
+down_revision = "20261017_02"
+branch_labels = None
+depends_on = None
+
+PREVIOUS_DB_VERSION = "2026.10.17.02"
+DB_VERSION = "2026.10.17.03"
+
+
+def upgrade() -> None:
+    # A backward scan of this index serves ORDER BY created_at DESC.
+    op.create_index(
+        "ix_hypotheses_project_created",
+        "hypotheses",
+        ["project_id", "created_at"],
+        if_not_exists=True,
+    )
+
+    upsert_db_version(op.get_bind(), DB_VERSION)
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_hypotheses_project_created", table_name="hypotheses", if_exists=True
+    )
+    upsert_db_version(op.get_bind(), PREVIOUS_DB_VERSION)
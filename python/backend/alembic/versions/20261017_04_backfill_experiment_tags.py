@@ -0,0 +1,37 @@
+"""backfill empty experiment tags
+
+Revision ID: 20261017_04
+Revises: 20261017_03
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+from db.migration_utils import upsert_db_version
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_04"
+down_revision = "20261017_03"
+branch_labels = None
+depends_on = None
+
+PREVIOUS_DB_VERSION = "2026.10.17.03"
+DB_VERSION = "2026.10.17.04"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # One set-based statement instead of per-row updates.
+    empty_tags = "'[]'::jsonb" if bind.dialect.name == "postgresql" else "'[]'"
+    op.execute(sa.text(f"UPDATE experiments SET tags = {empty_tags} WHERE tags IS NULL"))
+
+    upsert_db_version(bind, DB_VERSION)
+
+
+def downgrade() -> None:
+    # The backfilled empty lists are valid tags; only the version is restored.
+    upsert_db_version(op.get_bind(), PREVIOUS_DB_VERSION)
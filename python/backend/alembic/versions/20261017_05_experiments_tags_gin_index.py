@@ -0,0 +1,47 @@
+"""add GIN index on experiments.tags
+
+Revision ID: 20261017_05
+Revises: 20261017_04
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+from db.migration_utils import upsert_db_version
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_05"
+down_revision = "20261017_04"
+branch_labels = None
+depends_on = None
+
+PREVIOUS_DB_VERSION = "2026.10.17.04"
+DB_VERSION = "2026.10.17.05"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        # jsonb_path_ops is smaller and faster than jsonb_ops for @> containment.
+        op.create_index(
+            "ix_experiments_tags_gin",
+            "experiments",
+            ["tags"],
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+            if_not_exists=True,
+        )
+
+    upsert_db_version(bind, DB_VERSION)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.drop_index(
+            "ix_experiments_tags_gin", table_name="experiments", if_exists=True
+        )
+    upsert_db_version(bind, PREVIOUS_DB_VERSION)
@@ -1,25 +1,42 @@
+import os
+import sys
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.cors import CORSMiddleware
 from api.routes.api import router as api_router
 from config.settings import get_settings
-from db.database import create_db_and_tables
+from lib.responses import PydanticJSONResponse
+from lib.warmup import warm_up_models
+from db.database import async_session_maker, create_db_and_tables
+from domain.api_tokens.service import LAST_USED_BATCHER
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await create_db_and_tables()
+    warm_up_models(app)
+    LAST_USED_BATCHER.start(async_session_maker)
     yield
+    await LAST_USED_BATCHER.stop()
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
-    app = FastAPI(title="ML Experiment Tracker API", version="1.0.0", lifespan=lifespan)
+    app = FastAPI(
+        title="ML Experiment Tracker API",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=PydanticJSONResponse,
+    )
 
+    allowed_origins = [
+        origin.strip() for origin in settings.allowed_origins.split(",") if origin.strip()
+    ]
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=list(map(str.strip, settings.allowed_origins.split(","))),
-        allow_credentials=True,
+        allow_origins=allowed_origins,
+        # Credentialed requests are not allowed with a wildcard origin.
+        allow_credentials="*" not in allowed_origins,
         allow_methods=["*"],
         allow_headers=["*"],
     )
@@ -28,3 +45,17 @@ def create_app() -> FastAPI:
 
 
 app = create_app()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop and httptools ship with uvicorn[standard]; uvloop has no Windows build.
+    uvicorn.run(
+        "api.main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WORKERS", "4")),
+    )
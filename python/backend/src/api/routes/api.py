@@ -16,13 +16,23 @@ router = APIRouter()
 
 # Align paths with legacy backend/routes.py naming.
 API_PREFIX = get_settings().api_prefix
-router.include_router(projects_router)
-router.include_router(experiments_router)
-router.include_router(hypotheses_router)
-router.include_router(metrics_router)
-router.include_router(scalars_router)
-router.include_router(teams_router)
-router.include_router(dashboard_router)
-router.include_router(auth_router)
-router.include_router(api_tokens_router)
-router.include_router(object_storage_router)
+
+# The API prefix is applied once when this router is mounted in api/main.py.
+ROUTERS = (
+    projects_router,
+    experiments_router,
+    hypotheses_router,
+    metrics_router,
+    scalars_router,
+    teams_router,
+    dashboard_router,
+    auth_router,
+    api_tokens_router,
+    object_storage_router,
+)
+
+# Sub-routers carry no router-level prefix, tags or dependencies beyond what
+# is already baked into their routes, so their routes are adopted as-is
+# instead of being re-created by include_router.
+for sub_router in ROUTERS:
+    router.routes.extend(sub_router.routes)
@@ -1,8 +1,9 @@
+import logging
 import uuid
 from typing import Optional
 
 from api.routes.service_dependencies import get_api_token_service
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin
 from fastapi_users.authentication import (
@@ -19,12 +20,15 @@ from domain.api_tokens.error import (
     ApiTokenInvalidError,
     ApiTokenRevokedError,
 )
-from domain.api_tokens.service import ApiTokenService
+from domain.api_tokens.service import LAST_USED_BATCHER, ApiTokenService
 from domain.team.users.dto import UserCreate, UserRead, UserUpdate
 from models import User
 from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = logging.getLogger(__name__)
+
 SECRET = get_settings().jwt_secret
+JWT_LIFETIME = 3600 * 24 * 7
 
 
 class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
@@ -32,17 +36,18 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     verification_token_secret = SECRET
 
     async def on_after_register(self, user: User, request: Optional[Request] = None):
-        print(f"User {user.id} ({user.email}) has registered.")
+        logger.info("User %s (%s) has registered.", user.id, user.email)
 
     async def on_after_forgot_password(
         self, user: User, token: str, request: Optional[Request] = None
     ):
-        print(f"User {user.id} has requested password reset. Token: {token}")
+        # The token itself is a credential and is kept out of the logs.
+        logger.info("User %s has requested password reset.", user.id)
 
     async def on_after_request_verify(
         self, user: User, token: str, request: Optional[Request] = None
     ):
-        print(f"Verification requested for user {user.id}. Token: {token}")
+        logger.info("Verification requested for user %s.", user.id)
 
 
 async def get_user_manager(user_db: SQLAlchemyUserDatabase = Depends(get_user_db)):
@@ -53,8 +58,14 @@ API_PREFIX = get_settings().api_prefix
 bearer_transport = BearerTransport(tokenUrl=f"{API_PREFIX}/auth/jwt/login")
 
 
-def get_jwt_strategy() -> JWTStrategy:
-    return JWTStrategy(secret=SECRET, lifetime_seconds=3600 * 24 * 7)
+# JWTStrategy holds no per-request state, so one instance serves every request.
+_JWT_STRATEGY: JWTStrategy[User, uuid.UUID] = JWTStrategy(
+    secret=SECRET, lifetime_seconds=JWT_LIFETIME
+)
+
+
+def get_jwt_strategy() -> JWTStrategy[User, uuid.UUID]:
+    return _JWT_STRATEGY
 
 
 auth_backend = AuthenticationBackend(
@@ -72,64 +83,101 @@ current_superuser = fastapi_users.current_user(active=True, superuser=True)
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
+def _bearer_token(request: Request) -> str | None:
+    authorization = request.headers.get("authorization")
+    if not authorization or authorization[:7].lower() != "bearer ":
+        return None
+    return authorization[7:].strip() or None
+
+
+async def _authenticate_api_token(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    raw_token: str,
+    api_token_service: ApiTokenService,
+) -> User:
+    try:
+        token = await api_token_service.validate_token(raw_token)
+    except (ApiTokenInvalidError, ApiTokenRevokedError, ApiTokenExpiredError) as exc:
+        raise HTTPException(status_code=401, detail=str(exc)) from exc
+    if LAST_USED_BATCHER.running:
+        # Only records the timestamp in memory; the batcher writes it later.
+        await api_token_service.mark_used(token)
+    else:
+        # last_used_at is informational; write it after the response is sent.
+        # The request-scoped session stays open until background tasks finish
+        # (FastAPI >= 0.118, the floor pinned in pyproject.toml).
+        background_tasks.add_task(api_token_service.mark_used, token)
+    request.state.api_token_scopes = frozenset(token.scopes or ())
+    request.state.api_token_id = token.id
+    return token.user
+
+
 async def get_current_user_by_api_token(
     request: Request,
+    background_tasks: BackgroundTasks,
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     api_token_service: ApiTokenService = Depends(get_api_token_service),
 ):
     if credentials is None or not credentials.credentials:
         return None
-    try:
-        token = await api_token_service.validate_token(credentials.credentials)
-        await api_token_service.mark_used(token)
-        request.state.api_token_scopes = token.scopes or []
-        request.state.api_token_id = token.id
-        return token.user
-    except (ApiTokenInvalidError, ApiTokenRevokedError, ApiTokenExpiredError) as exc:
-        raise HTTPException(status_code=401, detail=str(exc)) from exc
+    return await _authenticate_api_token(
+        request, background_tasks, credentials.credentials, api_token_service
+    )
+
+
+async def _get_jwt_user(token: str, user_manager: UserManager) -> User | None:
+    user = await _JWT_STRATEGY.read_token(token, user_manager)
+    if user is None or not user.is_active:
+        return None
+    return user
 
 
 async def get_current_user_dual(
     request: Request,
-    jwt_user: User | None = Depends(current_active_user_optional),
-    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    background_tasks: BackgroundTasks,
     api_token_service: ApiTokenService = Depends(get_api_token_service),
+    session: AsyncSession = Depends(get_async_session),
 ) -> User:
-    token_value = credentials.credentials if credentials else None
-    if token_value and token_value.startswith("pat_"):
-        user = await get_current_user_by_api_token(
-            request=request,
-            credentials=credentials,
-            api_token_service=api_token_service,
-        )
-        if user is None:
-            raise HTTPException(status_code=401, detail="Invalid API token")
-        return user
-    if jwt_user is not None:
-        return jwt_user
-    if token_value:
-        user = await get_current_user_by_api_token(
-            request=request,
-            credentials=credentials,
-            api_token_service=api_token_service,
+    # Several dependencies of one request may resolve the user; do it once.
+    cached_user: User | None = getattr(request.state, "user", None)
+    if cached_user is not None:
+        return cached_user
+
+    # The header is read directly instead of through the HTTPBearer and
+    # fastapi-users dependencies, which would run for every request.
+    token_value = _bearer_token(request)
+    if token_value is None:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    user: User | None = None
+    # PATs never go through JWT decoding.
+    if not token_value.startswith("pat_"):
+        user_manager = UserManager(SQLAlchemyUserDatabase(session, User))
+        user = await _get_jwt_user(token_value, user_manager)
+    if user is None:
+        user = await _authenticate_api_token(
+            request, background_tasks, token_value, api_token_service
         )
-        if user is not None:
-            return user
-    raise HTTPException(status_code=401, detail="Not authenticated")
+    request.state.user = user
+    return user
 
 
 def require_api_token_scopes(required: str | list[str]):
-    required_list = [required] if isinstance(required, str) else list(required)
+    required_set = frozenset([required] if isinstance(required, str) else required)
 
-    async def _dependency(request: Request) -> None:
+    # Depending on get_current_user_dual guarantees the scopes are populated
+    # before the check; FastAPI caches it, so the user is resolved once.
+    async def _dependency(
+        request: Request, _user: User = Depends(get_current_user_dual)
+    ) -> None:
         scopes = getattr(request.state, "api_token_scopes", None)
         if scopes is None:
             return
-        missing = [scope for scope in required_list if scope not in scopes]
-        if missing:
+        if not required_set.issubset(scopes):
+            missing = required_set.difference(scopes)
             raise HTTPException(
                 status_code=403,
-                detail=f"API token missing scopes: {', '.join(missing)}",
+                detail=f"API token missing scopes: {', '.join(sorted(missing))}",
             )
 
     return _dependency
@@ -30,6 +30,9 @@ from domain.projects.service import ProjectService
 from domain.team.teams.repository import TeamRepository
 from domain.team.teams.service import TeamService
 
+# Read once at import; this dependency resolves on every scalars request.
+SCALARS_SERVICE_URL = get_settings().scalars_service_url
+
 
 async def get_project_repository(
     session: AsyncSession = Depends(get_async_session),
@@ -99,10 +102,8 @@ async def get_scalars_service(
     permission_checker: PermissionChecker = Depends(get_permission_checker),
     experiment_repository: ExperimentRepository = Depends(get_experiment_repository),
 ) -> ScalarsServiceProtocol:
-    settings = get_settings()
-    scalars_service_url = settings.scalars_service_url
-    if scalars_service_url:
-        client = ScalarsServiceClient(scalars_service_url)
+    if SCALARS_SERVICE_URL:
+        client = ScalarsServiceClient(SCALARS_SERVICE_URL)
         return ScalarsService(client, permission_checker, experiment_repository)
     else:
         return NoOpScalarsService()
@@ -1,3 +1,4 @@
+import os
 from functools import lru_cache
 from pydantic_settings import BaseSettings
 
@@ -10,6 +11,13 @@ class Settings(BaseSettings):
     jwt_secret: str = "CHANGE-ME-IN-PRODUCTION-SECRET-KEY-12345"
     app_name: str = "Experiment Tracker"
     allowed_origins: str = "*"
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_prepared_statement_cache_size: int = 500
+    # Set when connecting through PgBouncer in transaction pooling mode.
+    db_external_pooler: bool = False
     scalars_service_url: str = "http://127.0.0.1:8001/api"
     object_storage_service_url: str = "http://127.0.0.1:8010/api"
 
@@ -24,4 +32,5 @@ def get_settings() -> Settings:
     return Settings()
 
 
-pprint(get_settings().model_dump())
+if os.getenv("DEBUG_SETTINGS"):
+    pprint(get_settings().model_dump())
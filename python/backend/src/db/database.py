@@ -1,19 +1,58 @@
 import os
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Iterable, Sequence
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
 from config.settings import get_settings
 from fastapi import Depends
 from fastapi_users.db import SQLAlchemyUserDatabase
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from models import Base, User
 from db.utils import build_async_database_url
 
 DATABASE_URL = build_async_database_url(get_settings().database_url)
 
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    options: dict[str, Any] = {"pool_pre_ping": True}
+    # SQLite engines use single-connection pools that do not accept sizing.
+    if database_url.startswith("sqlite"):
+        options["insertmanyvalues_page_size"] = 1000
+        return options
+
+    # Larger multi-row INSERT pages mean fewer round-trips on bulk flushes.
+    options["insertmanyvalues_page_size"] = 10000
+
+    settings = get_settings()
+    if settings.db_external_pooler:
+        # PgBouncer already pools connections, and in transaction mode a
+        # server connection can change between statements, so neither a
+        # second pool nor per-connection prepared statements may be kept.
+        options["poolclass"] = NullPool
+        if database_url.startswith("postgresql+asyncpg"):
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+            }
+        return options
+
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    if database_url.startswith("postgresql+asyncpg"):
+        # Reuse prepared statements per connection instead of re-parsing each query.
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size
+        }
+    return options
+
+
 try:
-    engine = create_async_engine(DATABASE_URL, pool_pre_ping=True)
+    engine = create_async_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
     async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 except Exception as e:
     raise RuntimeError(
@@ -34,5 +73,27 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             yield session
 
 
+async def bulk_copy(
+    session: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[Sequence[Any]],
+) -> None:
+    """
+    Insert rows through asyncpg's COPY protocol on the session's connection.
+
+    Only valid for ``postgresql+asyncpg`` sessions; the rows join the session's
+    current transaction, so the caller still commits as usual.
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if driver_connection is None:
+        raise RuntimeError("bulk_copy needs an open driver connection")
+    await driver_connection.copy_records_to_table(
+        table, records=list(records), columns=list(columns)
+    )
+
+
 async def get_user_db(session: AsyncSession = Depends(get_async_session)):
     yield SQLAlchemyUserDatabase(session, User)
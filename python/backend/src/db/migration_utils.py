@@ -0,0 +1,65 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+def upsert_db_version(bind: Connection, version: str) -> None:
+    """Write ``version`` into the single ``db_metadata`` row on any dialect."""
+    dialect = bind.dialect.name
+
+    if dialect in {"postgresql", "sqlite"}:
+        bind.execute(
+            text(
+                """
+                INSERT INTO db_metadata (id, version)
+                VALUES (1, :version)
+                ON CONFLICT (id) DO UPDATE SET version = EXCLUDED.version
+                """
+            ),
+            {"version": version},
+        )
+        return
+
+    if dialect in {"mysql", "mariadb"}:
+        bind.execute(
+            text(
+                """
+                INSERT INTO db_metadata (id, version)
+                VALUES (1, :version)
+                ON DUPLICATE KEY UPDATE version = VALUES(version)
+                """
+            ),
+            {"version": version},
+        )
+        return
+
+    if dialect in {"mssql", "oracle"}:
+        source = (
+            "SELECT 1 AS id, :version AS version FROM dual"
+            if dialect == "oracle"
+            else "SELECT 1 AS id, :version AS version"
+        )
+        bind.execute(
+            text(
+                f"""
+                MERGE INTO db_metadata target
+                USING ({source}) source
+                ON (target.id = source.id)
+                WHEN MATCHED THEN UPDATE SET target.version = source.version
+                WHEN NOT MATCHED THEN INSERT (id, version)
+                VALUES (source.id, source.version)
+                {";" if dialect == "mssql" else ""}
+                """
+            ),
+            {"version": version},
+        )
+        return
+
+    result = bind.execute(
+        text("UPDATE db_metadata SET version = :version WHERE id = 1"),
+        {"version": version},
+    )
+    if result.rowcount == 0:
+        bind.execute(
+            text("INSERT INTO db_metadata (id, version) VALUES (1, :version)"),
+            {"version": version},
+        )
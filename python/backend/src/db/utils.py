@@ -1,6 +1,8 @@
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
 
+@lru_cache(maxsize=4)
 def build_async_database_url(url: str) -> str:
     if not url:
         raise RuntimeError(
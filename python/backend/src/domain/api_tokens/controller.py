@@ -4,6 +4,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 
 from api.routes.auth import current_active_user
+from lib.streaming import STREAM_THRESHOLD, json_array_response
 from models import User
 
 from .dto import (
@@ -48,7 +49,12 @@ async def list_api_tokens(
     user: User = Depends(current_active_user),
     api_token_service: ApiTokenService = Depends(get_api_token_service),
 ):
-    return await api_token_service.list_tokens(user.id)
+    # Most users hold a handful of tokens; only stream when the first page
+    # shows the list is larger than that.
+    tokens = await api_token_service.list_tokens(user.id, limit=STREAM_THRESHOLD + 1)
+    if len(tokens) <= STREAM_THRESHOLD:
+        return tokens
+    return json_array_response(api_token_service.stream_tokens(user.id))
 
 
 @router.patch("/{token_id}", response_model=ApiTokenListItemDTO)
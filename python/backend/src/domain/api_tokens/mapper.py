@@ -1,4 +1,6 @@
-from typing import List
+from typing import List, Sequence
+
+from sqlalchemy import Row
 
 from models import ApiToken
 
@@ -6,8 +8,12 @@ from .dto import ApiTokenCreateResponseDTO, ApiTokenListItemDTO
 
 
 class ApiTokenMapper:
-    def token_schema_to_list_item_dto(self, token: ApiToken) -> ApiTokenListItemDTO:
-        return ApiTokenListItemDTO(
+    # Rows come from the database, so the DTOs are built without re-validation.
+    # List items accept ORM objects as well as LIST_ITEM_COLUMNS rows.
+    def token_schema_to_list_item_dto(
+        self, token: ApiToken | Row
+    ) -> ApiTokenListItemDTO:
+        return ApiTokenListItemDTO.model_construct(
             id=token.id,
             name=token.name,
             description=token.description,
@@ -19,14 +25,14 @@ class ApiTokenMapper:
         )
 
     def token_schema_list_to_list_item_dto(
-        self, tokens: List[ApiToken]
+        self, tokens: Sequence[ApiToken | Row]
     ) -> List[ApiTokenListItemDTO]:
         return [self.token_schema_to_list_item_dto(token) for token in tokens]
 
     def token_schema_to_create_response_dto(
         self, token: ApiToken, raw_token: str
     ) -> ApiTokenCreateResponseDTO:
-        return ApiTokenCreateResponseDTO(
+        return ApiTokenCreateResponseDTO.model_construct(
             id=token.id,
             name=token.name,
             token=raw_token,
@@ -1,20 +1,52 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, Mapping, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, case, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import make_transient_to_detached, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from models import ApiToken
 
 
+def _copy_columns(obj):
+    model = type(obj)
+    return model(
+        **{attr.key: getattr(obj, attr.key) for attr in inspect(model).column_attrs}
+    )
+
+
+# Columns rendered by ApiTokenListItemDTO; listings skip the hash, the user
+# relationship and ORM hydration entirely.
+LIST_ITEM_COLUMNS = (
+    ApiToken.id,
+    ApiToken.name,
+    ApiToken.description,
+    ApiToken.scopes,
+    ApiToken.created_at,
+    ApiToken.expires_at,
+    ApiToken.revoked,
+    ApiToken.last_used_at,
+)
+
+
+def _list_items_query(user_id: UUID) -> Select:
+    return (
+        select(*LIST_ITEM_COLUMNS)
+        .where(ApiToken.user_id == user_id)
+        .order_by(ApiToken.created_at.desc())
+    )
+
+
 class ApiTokenRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create(self, token: ApiToken) -> ApiToken:
+        # Defaults are filled in by the flush (eager_defaults); no refresh SELECT.
         self.db.add(token)
-        await self.db.refresh(token)
+        await self.db.flush()
         return token
 
     async def get_by_id(self, token_id: UUID, user_id: UUID) -> Optional[ApiToken]:
@@ -25,13 +57,23 @@ class ApiTokenRepository:
         )
         return result.scalar_one_or_none()
 
-    async def list_by_user(self, user_id: UUID) -> List[ApiToken]:
-        result = await self.db.execute(
-            select(ApiToken)
-            .where(ApiToken.user_id == user_id)
-            .order_by(ApiToken.created_at.desc())
+    async def list_by_user(
+        self, user_id: UUID, limit: Optional[int] = None
+    ) -> Sequence[Row]:
+        query = _list_items_query(user_id)
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.db.execute(query)
+        return result.all()
+
+    async def stream_by_user(
+        self, user_id: UUID, batch_size: int = 1000
+    ) -> AsyncIterator[Row]:
+        result = await self.db.stream(
+            _list_items_query(user_id).execution_options(yield_per=batch_size)
         )
-        return list(result.scalars().all())
+        async for row in result:
+            yield row
 
     async def get_by_hash(self, token_hash: str) -> Optional[ApiToken]:
         result = await self.db.execute(
@@ -44,5 +86,42 @@ class ApiTokenRepository:
 
     async def update(self, token: ApiToken) -> ApiToken:
         self.db.add(token)
-        await self.db.refresh(token)
+        await self.db.flush()
         return token
+
+    async def touch_last_used(self, token: ApiToken, used_at: datetime) -> None:
+        # A bare UPDATE: no SELECT and no unit-of-work flush for a timestamp.
+        await self.db.execute(
+            update(ApiToken)
+            .where(ApiToken.id == token.id)
+            .values(last_used_at=used_at)
+            .execution_options(synchronize_session=False)
+        )
+        set_committed_value(token, "last_used_at", used_at)
+
+    async def bulk_touch_last_used(self, used_at: Mapping[UUID, datetime]) -> None:
+        if not used_at:
+            return
+        # Explicit comparisons keep the UUID column type on each WHEN clause.
+        last_used_at = case(
+            *((ApiToken.id == token_id, value) for token_id, value in used_at.items())
+        )
+        await self.db.execute(
+            update(ApiToken)
+            .where(ApiToken.id.in_(used_at.keys()))
+            .values(last_used_at=last_used_at)
+            .execution_options(synchronize_session=False)
+        )
+
+    def detached_copy(self, token: ApiToken) -> ApiToken:
+        """
+        Build a clean, session-less copy of ``token`` and its user.
+
+        The copy can be cached and attached to other sessions with
+        ``merge(..., load=False)`` without touching the original instance.
+        """
+        copy: ApiToken = _copy_columns(token)
+        copy.user = _copy_columns(token.user)
+        make_transient_to_detached(copy.user)
+        make_transient_to_detached(copy)
+        return copy
@@ -1,11 +1,12 @@
+import asyncio
 import hashlib
-import hmac
 import logging
 import secrets
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import AsyncIterator, Callable, Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -37,36 +38,134 @@ def hash_token(raw_token: str) -> str:
 class CachedToken:
     token_id: UUID
     user_id: UUID
-    scopes: list[str]
+    scopes: frozenset[str]
     expires_at: Optional[datetime]
     revoked: bool
-    expires_at_ts: float
+    # Cache-entry deadline on the time.monotonic_ns() clock.
+    expires_at_ns: int
+    # Detached, unmodified copy of the validated row (user included).
+    token: ApiToken
 
 
 class TokenCache:
-    def __init__(self, ttl_seconds: int = 60):
+    """
+    Bounded in-process LRU cache of validated API tokens.
+
+    Keys are blake2b digests of the raw token, so a hit skips both the SHA-256
+    hash and the lookup query. Entries expire after ``ttl_seconds`` and the
+    least recently used entry is evicted once ``maxsize`` is reached. Updating
+    or revoking a token drops its entry through ``invalidate_token``.
+
+    The cache is per process. A token revoked or updated through another
+    worker stays valid here until its entry expires, i.e. for up to
+    ``ttl_seconds`` (60s by default).
+
+    The cache is only touched from the event loop thread and none of its
+    methods await, so each operation runs to completion without locking.
+    """
+
+    def __init__(self, ttl_seconds: int = 60, maxsize: int = 10_000):
         self.ttl_seconds = ttl_seconds
-        self._cache: dict[str, CachedToken] = {}
+        self.ttl_ns = ttl_seconds * 1_000_000_000
+        self.maxsize = maxsize
+        self._cache: OrderedDict[bytes, CachedToken] = OrderedDict()
+        self._keys_by_token_id: dict[UUID, bytes] = {}
+
+    @staticmethod
+    def key(raw_token: str) -> bytes:
+        return hashlib.blake2b(raw_token.encode("utf-8"), digest_size=16).digest()
 
-    def get(self, token_hash: str) -> Optional[CachedToken]:
-        cached = self._cache.get(token_hash)
+    def get(self, key: bytes) -> Optional[CachedToken]:
+        cached = self._cache.get(key)
         if cached is None:
             return None
-        if cached.expires_at_ts < time.time():
-            self._cache.pop(token_hash, None)
+        if cached.expires_at_ns < time.monotonic_ns():
+            self.invalidate(key)
             return None
+        self._cache.move_to_end(key)
         return cached
 
-    def set(self, token_hash: str, token: CachedToken) -> None:
-        self._cache[token_hash] = token
+    def set(self, key: bytes, token: CachedToken) -> None:
+        self._cache[key] = token
+        self._cache.move_to_end(key)
+        self._keys_by_token_id[token.token_id] = key
+        while len(self._cache) > self.maxsize:
+            _, evicted = self._cache.popitem(last=False)
+            self._keys_by_token_id.pop(evicted.token_id, None)
+
+    def invalidate(self, key: bytes) -> None:
+        cached = self._cache.pop(key, None)
+        if cached is not None:
+            self._keys_by_token_id.pop(cached.token_id, None)
 
-    def invalidate(self, token_hash: str) -> None:
-        self._cache.pop(token_hash, None)
+    def invalidate_token(self, token_id: UUID) -> None:
+        key = self._keys_by_token_id.pop(token_id, None)
+        if key is not None:
+            self._cache.pop(key, None)
 
 
 TOKEN_CACHE = TokenCache()
 
 
+class LastUsedBatcher:
+    """
+    Coalesces ``last_used_at`` writes into one UPDATE per flush interval.
+
+    ``record`` only stores the latest timestamp per token; a background loop
+    started from the app lifespan writes the pending batch every
+    ``interval_seconds`` and once more on shutdown.
+    """
+
+    def __init__(self, interval_seconds: float = 5.0):
+        self.interval_seconds = interval_seconds
+        self._pending: dict[UUID, datetime] = {}
+        self._session_factory: Optional[Callable[[], AsyncSession]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def record(self, token_id: UUID, used_at: datetime) -> None:
+        self._pending[token_id] = used_at
+
+    def start(self, session_factory: Callable[[], AsyncSession]) -> None:
+        if self._task is None:
+            self._session_factory = session_factory
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending or self._session_factory is None:
+            return
+        # Swap before awaiting so records made during the write land in the next batch.
+        pending, self._pending = self._pending, {}
+        async with self._session_factory() as session:
+            await ApiTokenRepository(session).bulk_touch_last_used(pending)
+            await session.commit()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("api_token_last_used_flush_failed")
+
+
+LAST_USED_BATCHER = LastUsedBatcher()
+
+
 class ApiTokenService:
     def __init__(self, db: AsyncSession, api_token_repository: ApiTokenRepository):
         self.db = db
@@ -108,10 +207,16 @@ class ApiTokenService:
         await self.db.commit()
         return self.mapper.token_schema_to_create_response_dto(token, raw_token)
 
-    async def list_tokens(self, user_id: UUID) -> list[ApiTokenListItemDTO]:
-        tokens = await self.api_token_repository.list_by_user(user_id)
+    async def list_tokens(
+        self, user_id: UUID, limit: Optional[int] = None
+    ) -> list[ApiTokenListItemDTO]:
+        tokens = await self.api_token_repository.list_by_user(user_id, limit)
         return self.mapper.token_schema_list_to_list_item_dto(tokens)
 
+    async def stream_tokens(self, user_id: UUID) -> AsyncIterator[ApiTokenListItemDTO]:
+        async for token in self.api_token_repository.stream_by_user(user_id):
+            yield self.mapper.token_schema_to_list_item_dto(token)
+
     async def update_token(
         self,
         user_id: UUID,
@@ -138,6 +243,9 @@ class ApiTokenService:
             extra={"token_id": str(token.id), "user_id": str(user_id)},
         )
         await self.db.commit()
+        # Only after the commit: a validation racing the write would otherwise
+        # re-cache the old row for a full TTL.
+        TOKEN_CACHE.invalidate_token(token.id)
         return self.mapper.token_schema_to_list_item_dto(token)
 
     async def revoke_token(self, user_id: UUID, token_id: UUID) -> ApiTokenListItemDTO:
@@ -151,23 +259,29 @@ class ApiTokenService:
             extra={"token_id": str(token.id), "user_id": str(user_id)},
         )
         await self.db.commit()
+        # Only after the commit: a validation racing the write would otherwise
+        # re-cache the old row for a full TTL.
+        TOKEN_CACHE.invalidate_token(token.id)
         return self.mapper.token_schema_to_list_item_dto(token)
 
     async def validate_token(self, raw_token: str) -> ApiToken:
-        token_hash = hash_token(raw_token)
-        cached = TOKEN_CACHE.get(token_hash)
+        cache_key = TOKEN_CACHE.key(raw_token)
+        cached = TOKEN_CACHE.get(cache_key)
         if cached:
+            # Revocation and expiry are checked against the cached copy. A token
+            # revoked through another worker is still accepted here for up to
+            # TOKEN_CACHE.ttl_seconds.
             if cached.revoked:
                 raise ApiTokenRevokedError("Token revoked")
             if cached.expires_at and cached.expires_at <= utc_now():
                 raise ApiTokenExpiredError("Token expired")
-            token = await self.api_token_repository.get_by_hash(token_hash)
-            if token is None or not hmac.compare_digest(token.token_hash, token_hash):
-                raise ApiTokenInvalidError("Token invalid")
-            return token
+            # load=False attaches the cached copy to this session without a query.
+            return await self.db.merge(cached.token, load=False)
 
+        token_hash = hash_token(raw_token)
         token = await self.api_token_repository.get_by_hash(token_hash)
-        if token is None or not hmac.compare_digest(token.token_hash, token_hash):
+        # The row was matched on token_hash by the query itself.
+        if token is None:
             raise ApiTokenInvalidError("Token invalid")
         if token.revoked:
             raise ApiTokenRevokedError("Token revoked")
@@ -175,26 +289,29 @@ class ApiTokenService:
             raise ApiTokenExpiredError("Token expired")
 
         TOKEN_CACHE.set(
-            token_hash,
+            cache_key,
             CachedToken(
                 token_id=token.id,
                 user_id=token.user_id,
-                scopes=token.scopes or [],
+                scopes=frozenset(token.scopes or ()),
                 expires_at=token.expires_at,
                 revoked=token.revoked,
-                expires_at_ts=time.time() + TOKEN_CACHE.ttl_seconds,
+                expires_at_ns=time.monotonic_ns() + TOKEN_CACHE.ttl_ns,
+                token=self.api_token_repository.detached_copy(token),
             ),
         )
-        await self.db.commit()
+        # Validation only reads; the request's write path owns the commit.
         return token
 
     async def mark_used(self, token: ApiToken) -> None:
-        token.last_used_at = utc_now()
-        await self.api_token_repository.update(token)
         logger.info(
             "api_token_used",
             extra={"token_id": str(token.id), "user_id": str(token.user_id)},
         )
+        if LAST_USED_BATCHER.running:
+            LAST_USED_BATCHER.record(token.id, utc_now())
+            return
+        await self.api_token_repository.touch_last_used(token, utc_now())
         await self.db.commit()
 
     async def get_user_for_token(self, raw_token: str) -> User:
@@ -1,8 +1,10 @@
-from typing import List
+from functools import wraps
+from typing import Any, Awaitable, Callable, List
 from uuid import UUID
 
 from api.routes.service_dependencies import get_experiment_service, get_metric_service
 from domain.metrics.dto import MetricDTO
+from domain.metrics.error import MetricError, MetricNotFoundError
 from domain.metrics.service import MetricService
 from fastapi import APIRouter, Depends, HTTPException, Query
 
@@ -15,22 +17,45 @@ from .dto import (
     ExperimentReorderDTO,
     ExperimentUpdateDTO,
 )
-from .error import ExperimentNamePatternNotSetError, ExperimentNotAccessibleError
+from lib.db.error import DBError, DBNotFoundError
+from lib.streaming import STREAM_THRESHOLD, json_array_response
+
+from .error import ExperimentError, ExperimentNotAccessibleError
 from .service import ExperimentService
 from domain.rbac.permissions import ProjectActions
 
 router = APIRouter(prefix="/experiments", tags=["experiments"])
 
 
-def _raise_experiment_http_error(error: Exception) -> None:
-    if isinstance(error, ExperimentNotAccessibleError):
-        raise HTTPException(status_code=404, detail=str(error))
-    if isinstance(error, ExperimentNamePatternNotSetError):
-        raise HTTPException(status_code=400, detail=str(error))
-    raise HTTPException(status_code=400, detail=str(error))
+# Errors the experiment routes translate; anything else is a server error.
+EXPERIMENT_ROUTE_ERRORS = (ExperimentError, MetricError, DBError)
+
+_ERROR_STATUS: dict[type[Exception], int] = {
+    ExperimentNotAccessibleError: 404,
+    MetricNotFoundError: 404,
+    DBNotFoundError: 404,
+}
+
+
+def _experiment_http_errors(
+    endpoint: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """Turn the domain errors of an experiment endpoint into HTTP responses."""
+
+    @wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await endpoint(*args, **kwargs)
+        except EXPERIMENT_ROUTE_ERRORS as exc:
+            raise HTTPException(
+                status_code=_ERROR_STATUS.get(type(exc), 400), detail=str(exc)
+            ) from exc
+
+    return wrapper
 
 
 @router.get("/recent", response_model=List[ExperimentDTO])
+@_experiment_http_errors
 async def get_recent_experiments(
     limit: int = 10,
     user: User = Depends(get_current_user_dual),
@@ -40,56 +65,50 @@ async def get_recent_experiments(
     _: None = Depends(require_api_token_scopes(ProjectActions.VIEW_EXPERIMENT)),
     experiment_service: ExperimentService = Depends(get_experiment_service),
 ):
-    try:
-        return await experiment_service.get_recent_experiments(user, project_id, limit)
-    except Exception as exc:  # noqa: BLE001
-        _raise_experiment_http_error(exc)
+    if limit > STREAM_THRESHOLD:
+        return json_array_response(
+            await experiment_service.stream_recent_experiments(user, project_id, limit)
+        )
+    return await experiment_service.get_recent_experiments(user, project_id, limit)
 
 
 @router.get("/{experiment_id}/metrics", response_model=List[MetricDTO])
+@_experiment_http_errors
 async def get_experiment_metrics(
     experiment_id: UUID,
     user: User = Depends(get_current_user_dual),
     _: None = Depends(require_api_token_scopes(ProjectActions.VIEW_METRIC)),
     metric_service: MetricService = Depends(get_metric_service),
 ):
-    try:
-        return await metric_service.get_aggregated_metrics_for_experiment(
-            user, experiment_id
-        )
-    except Exception as exc:  # noqa: BLE001
-        _raise_experiment_http_error(exc)
+    return await metric_service.get_aggregated_metrics_for_experiment(
+        user, experiment_id
+    )
 
 
 @router.get("/{experiment_id}", response_model=ExperimentDTO)
+@_experiment_http_errors
 async def get_experiment(
     experiment_id: UUID,
     user: User = Depends(get_current_user_dual),
     _: None = Depends(require_api_token_scopes(ProjectActions.VIEW_EXPERIMENT)),
     experiment_service: ExperimentService = Depends(get_experiment_service),
 ):
-    try:
-        return await experiment_service.get_experiment_if_accessible(
-            user, experiment_id
-        )
-    except Exception as exc:  # noqa: BLE001
-        _raise_experiment_http_error(exc)
+    return await experiment_service.get_experiment_if_accessible(user, experiment_id)
 
 
 @router.post("", response_model=ExperimentDTO)
+@_experiment_http_errors
 async def create_experiment(
     data: ExperimentCreateDTO,
     user: User = Depends(get_current_user_dual),
     _: None = Depends(require_api_token_scopes(ProjectActions.CREATE_EXPERIMENT)),
     experiment_service: ExperimentService = Depends(get_experiment_service),
 ):
-    try:
-        return await experiment_service.create_experiment(user, data)
-    except Exception as exc:  # noqa: BLE001
-        _raise_experiment_http_error(exc)
+    return await experiment_service.create_experiment(user, data)
 
 
 @router.patch("/{experiment_id}", response_model=ExperimentDTO)
+@_experiment_http_errors
 async def update_experiment(
     experiment_id: UUID,
     data: ExperimentUpdateDTO,
@@ -97,39 +116,32 @@ async def update_experiment(
     _: None = Depends(require_api_token_scopes(ProjectActions.EDIT_EXPERIMENT)),
     experiment_service: ExperimentService = Depends(get_experiment_service),
 ):
-    try:
-        return await experiment_service.update_experiment(user, experiment_id, data)
-    except Exception as exc:  # noqa: BLE001
-        _raise_experiment_http_error(exc)
+    return await experiment_service.update_experiment(user, experiment_id, data)
 
 
 @router.delete("/{experiment_id}")
+@_experiment_http_errors
 async def delete_experiment(
     experiment_id: UUID,
     user: User = Depends(get_current_user_dual),
     _: None = Depends(require_api_token_scopes(ProjectActions.DELETE_EXPERIMENT)),
     experiment_service: ExperimentService = Depends(get_experiment_service),
 ):
-    try:
-        success = await experiment_service.delete_experiment(user, experiment_id)
-    except Exception as exc:  # noqa: BLE001
-        _raise_experiment_http_error(exc)
+    success = await experiment_service.delete_experiment(user, experiment_id)
     if not success:
         raise HTTPException(status_code=404, detail="Experiment not found")
     return {"success": True}
 
 
 @router.post("/reorder")
+@_experiment_http_errors
 async def reorder_experiments(
     data: ExperimentReorderDTO,
     user: User = Depends(get_current_user_dual),
     _: None = Depends(require_api_token_scopes(ProjectActions.EDIT_EXPERIMENT)),
     experiment_service: ExperimentService = Depends(get_experiment_service),
 ):
-    try:
-        await experiment_service.reorder_experiments(
-            user, data.project_id, data.experiment_ids
-        )
-    except Exception as exc:  # noqa: BLE001
-        _raise_experiment_http_error(exc)
+    await experiment_service.reorder_experiments(
+        user, data.project_id, data.experiment_ids
+    )
     return {"success": True}
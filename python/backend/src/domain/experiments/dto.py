@@ -8,6 +8,8 @@ from models import ExperimentStatus
 
 from lib.dto_config import model_config
 
+_COLOR_RE = re.compile(r"^#[0-9a-fA-F]{6}$")
+
 
 class ExperimentBaseDTO(BaseModel):
     project_id: UUID
@@ -26,7 +28,7 @@ class ExperimentBaseDTO(BaseModel):
     @field_validator("color")
     @classmethod
     def validate_color(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and not re.match(r"^#[0-9a-fA-F]{6}$", v):
+        if v is not None and not _COLOR_RE.match(v):
             raise ValueError("Invalid color")
         return v
 
@@ -58,7 +60,7 @@ class ExperimentDTO(ExperimentBaseDTO):
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
 
-    model_config = model_config()
+    model_config = model_config(trusted=True)
 
 
 class ExperimentReorderDTO(BaseModel):
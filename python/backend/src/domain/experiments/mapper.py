@@ -1,6 +1,7 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import Row
 
-from lib.dto_converter import DtoConverter
 from .dto import (
     ExperimentCreateDTO,
     ExperimentDTO,
@@ -13,8 +14,10 @@ class ExperimentMapper:
     def __init__(self):
         pass
 
-    def experiment_schema_to_dto(self, experiment: Experiment) -> ExperimentDTO:
-        return ExperimentDTO(
+    # Rows come from the database, so the DTOs are built without re-validation.
+    # Accepts ORM objects as well as DTO_COLUMNS rows from the list queries.
+    def experiment_schema_to_dto(self, experiment: Experiment | Row) -> ExperimentDTO:
+        return ExperimentDTO.model_construct(
             id=experiment.id,
             project_id=experiment.project_id,
             name=experiment.name,
@@ -34,7 +37,7 @@ class ExperimentMapper:
         )
 
     def experiment_list_schema_to_dto(
-        self, experiments: List[Experiment]
+        self, experiments: Sequence[Experiment | Row]
     ) -> List[ExperimentDTO]:
         return [self.experiment_schema_to_dto(experiment) for experiment in experiments]
 
@@ -57,27 +60,5 @@ class ExperimentMapper:
     def experiment_update_dto_to_update_dict(
         self, experiment: ExperimentUpdateDTO
     ) -> Dict[str, Any]:
-        converter = DtoConverter[ExperimentUpdateDTO](ExperimentUpdateDTO)
-        converted_dto = converter.dto_to_partial_dict_with_dto_case(experiment)
-        updates = {}
-        if "name" in converted_dto:
-            updates["name"] = converted_dto["name"]
-        if "description" in converted_dto:
-            updates["description"] = converted_dto["description"]
-        if "parent_experiment_id" in converted_dto:
-            updates["parent_experiment_id"] = converted_dto["parent_experiment_id"]
-        if "color" in converted_dto:
-            updates["color"] = converted_dto["color"]
-        if "status" in converted_dto:
-            updates["status"] = converted_dto["status"]
-        if "features" in converted_dto:
-            updates["features"] = converted_dto["features"]
-        if "git_diff" in converted_dto:
-            updates["git_diff"] = converted_dto["git_diff"]
-        if "progress" in converted_dto:
-            updates["progress"] = converted_dto["progress"]
-        if "order" in converted_dto:
-            updates["order"] = converted_dto["order"]
-        if "tags" in converted_dto:
-            updates["tags"] = converted_dto["tags"]
-        return updates
+        # Only fields the client actually sent; keys match the model columns.
+        return experiment.model_dump(exclude_unset=True)
@@ -1,16 +1,49 @@
-from typing import List, Literal, Sequence
+from typing import AsyncIterator, List, Literal, Mapping, Sequence
+from uuid import UUID
 from advanced_alchemy.filters import LimitOffset
 from lib.db.base_repository import BaseRepository, ListOptions
+from lib.db.error import DBNotFoundError
 from lib.types import UUID_TYPE
-from models import Experiment
+from models import Experiment, Project
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from lib.protocols.user_protocol import UserProtocol
+from sqlalchemy import Row, Select, select, update
 from sqlalchemy.orm import selectinload
 
 
 LoadOptions = Sequence[Literal["project", "metrics"]] | bool
 
+# Columns rendered by ExperimentDTO; list endpoints select only these and
+# skip ORM hydration and the identity map.
+DTO_COLUMNS = (
+    Experiment.id,
+    Experiment.project_id,
+    Experiment.name,
+    Experiment.description,
+    Experiment.status,
+    Experiment.parent_experiment_id,
+    Experiment.features,
+    Experiment.features_diff,
+    Experiment.git_diff,
+    Experiment.progress,
+    Experiment.color,
+    Experiment.order,
+    Experiment.tags,
+    Experiment.created_at,
+    Experiment.started_at,
+    Experiment.completed_at,
+)
+
+
+def _latest_rows_query(project_id: UUID_TYPE, limit: int) -> Select:
+    return (
+        select(*DTO_COLUMNS)
+        .where(Experiment.project_id == project_id)
+        .order_by(Experiment.created_at.desc())
+        .limit(limit)
+    )
+
 
 class ExperimentRepository(BaseRepository[Experiment]):
     def __init__(self, db: AsyncSession):
@@ -35,13 +68,20 @@ class ExperimentRepository(BaseRepository[Experiment]):
 
     async def get_latest_experiments(
         self, project_id: UUID_TYPE, limit: int = 10
-    ) -> List[Experiment]:
-        experiments = await self.advanced_alchemy_repository.list(
-            Experiment.project_id == project_id,
-            LimitOffset(offset=0, limit=limit),
-            order_by=Experiment.created_at.desc(),
+    ) -> Sequence[Row]:
+        result = await self.db.execute(_latest_rows_query(project_id, limit))
+        return result.all()
+
+    async def stream_latest_experiments(
+        self, project_id: UUID_TYPE, limit: int, batch_size: int = 100
+    ) -> AsyncIterator[Row]:
+        result = await self.db.stream(
+            _latest_rows_query(project_id, limit).execution_options(
+                yield_per=batch_size
+            )
         )
-        return experiments
+        async for row in result:
+            yield row
 
     async def get_experiments_by_project(
         self, project_id: UUID_TYPE, full_load: LoadOptions = False
@@ -58,6 +98,79 @@ class ExperimentRepository(BaseRepository[Experiment]):
         )
         return experiments
 
+    async def get_experiment_rows_by_project(
+        self, project_id: UUID_TYPE
+    ) -> Sequence[Row]:
+        result = await self.db.execute(
+            select(*DTO_COLUMNS).where(Experiment.project_id == project_id)
+        )
+        return result.all()
+
+    async def stream_experiment_rows_by_project(
+        self, project_id: UUID_TYPE, batch_size: int = 500
+    ) -> AsyncIterator[Row]:
+        result = await self.db.stream(
+            select(*DTO_COLUMNS)
+            .where(Experiment.project_id == project_id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            yield row
+
+    async def get_project_ids(
+        self, experiment_ids: Sequence[UUID_TYPE]
+    ) -> dict[UUID, UUID]:
+        """Map each existing experiment id to its project id in one query."""
+        if not experiment_ids:
+            return {}
+        result = await self.db.execute(
+            select(Experiment.id, Experiment.project_id).where(
+                Experiment.id.in_(experiment_ids)
+            )
+        )
+        return {row.id: row.project_id for row in result}
+
+    async def get_with_team_id(
+        self, experiment_id: UUID_TYPE
+    ) -> tuple[Experiment, UUID | None]:
+        """Return the experiment and its project's team id in one query."""
+        result = await self.db.execute(
+            select(Experiment, Project.team_id)
+            .join(Project, Project.id == Experiment.project_id)
+            .where(Experiment.id == experiment_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise DBNotFoundError(f"Object with id {experiment_id} not found")
+        return row[0], row[1]
+
+    async def get_project_id(self, experiment_id: UUID_TYPE) -> UUID | None:
+        result = await self.db.execute(
+            select(Experiment.project_id).where(Experiment.id == experiment_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_experiment_ids_by_project(
+        self, project_id: UUID_TYPE
+    ) -> Sequence[UUID]:
+        result = await self.db.execute(
+            select(Experiment.id).where(Experiment.project_id == project_id)
+        )
+        return result.scalars().all()
+
+    async def set_orders(self, orders: Mapping[UUID, int]) -> None:
+        # ORM bulk UPDATE by primary key: one executemany instead of a
+        # SELECT + UPDATE per experiment.
+        if not orders:
+            return
+        await self.db.execute(
+            update(Experiment),
+            [
+                {"id": experiment_id, "order": order}
+                for experiment_id, order in orders.items()
+            ],
+        )
+
     async def get_experiments_by_ids(
         self, experiment_ids: List[UUID_TYPE]
     ) -> List[Experiment]:
@@ -1,4 +1,5 @@
-from typing import List
+from typing import AsyncIterator, Awaitable, Callable, List
+from uuid import UUID
 
 from .error import ExperimentNotAccessibleError
 from lib.db.base_repository import ListOptions
@@ -13,6 +14,10 @@ from .dto import (
 )
 from .mapper import ExperimentMapper
 from domain.rbac.wrapper import PermissionChecker
+from models import Experiment
+
+# The mapper is stateless, so every service instance shares one.
+_EXPERIMENT_MAPPER = ExperimentMapper()
 
 
 class ExperimentService:
@@ -25,7 +30,7 @@ class ExperimentService:
         self.db = db
         self.experiment_repository = experiment_repository
         self.permission_checker = permission_checker
-        self.experiment_mapper = ExperimentMapper()
+        self.experiment_mapper = _EXPERIMENT_MAPPER
 
     async def get_recent_experiments(
         self, user: UserProtocol, project_id: UUID_TYPE, limit: int = 10
@@ -39,16 +44,57 @@ class ExperimentService:
         )
         return self.experiment_mapper.experiment_list_schema_to_dto(experiments)
 
+    async def stream_recent_experiments(
+        self, user: UserProtocol, project_id: UUID_TYPE, limit: int
+    ) -> AsyncIterator[ExperimentDTO]:
+        # Checked before returning the iterator: once streaming starts the
+        # response status can no longer change.
+        if not await self.permission_checker.can_view_experiment(user.id, project_id):
+            raise ExperimentNotAccessibleError(
+                f"You are not allowed to view experiments in project {project_id}"
+            )
+        return self._iter_recent_experiments(project_id, limit)
+
+    async def _iter_recent_experiments(
+        self, project_id: UUID_TYPE, limit: int
+    ) -> AsyncIterator[ExperimentDTO]:
+        async for experiment in self.experiment_repository.stream_latest_experiments(
+            project_id, limit
+        ):
+            yield self.experiment_mapper.experiment_schema_to_dto(experiment)
+
+    async def _iter_project_experiments(
+        self, project_id: UUID_TYPE
+    ) -> AsyncIterator[ExperimentDTO]:
+        rows = self.experiment_repository.stream_experiment_rows_by_project(project_id)
+        async for experiment in rows:
+            yield self.experiment_mapper.experiment_schema_to_dto(experiment)
+
+    async def _get_experiment_checked(
+        self,
+        user: UserProtocol,
+        experiment_id: UUID_TYPE,
+        can_access: Callable[[UUID, UUID], Awaitable[bool]],
+        denied_message: str,
+    ) -> Experiment:
+        experiment, team_id = await self.experiment_repository.get_with_team_id(
+            experiment_id
+        )
+        # The team fallback of the permission check reuses the joined team id.
+        self.permission_checker.remember_project_team(experiment.project_id, team_id)
+        if not await can_access(user.id, experiment.project_id):
+            raise ExperimentNotAccessibleError(denied_message)
+        return experiment
+
     async def get_experiment_if_accessible(
         self, user: UserProtocol, experiment_id: UUID_TYPE
     ) -> ExperimentDTO | None:
-        experiment = await self.experiment_repository.get_by_id(experiment_id)
-        if not await self.permission_checker.can_view_experiment(
-            user.id, experiment.project_id
-        ):
-            raise ExperimentNotAccessibleError(
-                f"Experiment {experiment_id} not accessible"
-            )
+        experiment = await self._get_experiment_checked(
+            user,
+            experiment_id,
+            self.permission_checker.can_view_experiment,
+            f"Experiment {experiment_id} not accessible",
+        )
         return self.experiment_mapper.experiment_schema_to_dto(experiment)
 
     async def create_experiment(
@@ -62,12 +108,15 @@ class ExperimentService:
             )
         if data.parent_experiment_id:
             parent_id = data.parent_experiment_id
-            experiment = await self.experiment_repository.get_by_id(parent_id)
-            if not experiment:
+            # Only the parent's project is needed, not the whole row.
+            parent_project_id = await self.experiment_repository.get_project_id(
+                parent_id
+            )
+            if parent_project_id is None:
                 raise ExperimentNotAccessibleError(
                     f"Parent experiment {parent_id} not found"
                 )
-            if experiment.project_id != data.project_id:
+            if parent_project_id != data.project_id:
                 raise ExperimentNotAccessibleError(
                     f"Parent experiment {parent_id} not in project {data.project_id}"
                 )
@@ -80,13 +129,12 @@ class ExperimentService:
     async def update_experiment(
         self, user: UserProtocol, experiment_id: UUID_TYPE, data: ExperimentUpdateDTO
     ) -> ExperimentDTO:
-        experiment = await self.experiment_repository.get_by_id(experiment_id)
-        if not await self.permission_checker.can_edit_experiment(
-            user.id, experiment.project_id
-        ):
-            raise ExperimentNotAccessibleError(
-                f"You are not allowed to edit experiment {experiment_id}"
-            )
+        await self._get_experiment_checked(
+            user,
+            experiment_id,
+            self.permission_checker.can_edit_experiment,
+            f"You are not allowed to edit experiment {experiment_id}",
+        )
         updates = self.experiment_mapper.experiment_update_dto_to_update_dict(data)
         result = await self.experiment_repository.update(experiment_id, **updates)
         await self.db.commit()
@@ -96,13 +144,12 @@ class ExperimentService:
     async def delete_experiment(
         self, user: UserProtocol, experiment_id: UUID_TYPE
     ) -> bool:
-        experiment = await self.experiment_repository.get_by_id(experiment_id)
-        if not await self.permission_checker.can_delete_experiment(
-            user.id, experiment.project_id
-        ):
-            raise ExperimentNotAccessibleError(
-                f"You are not allowed to delete experiment {experiment_id}"
-            )
+        await self._get_experiment_checked(
+            user,
+            experiment_id,
+            self.permission_checker.can_delete_experiment,
+            f"You are not allowed to delete experiment {experiment_id}",
+        )
         await self.experiment_repository.delete(experiment_id)
         await self.db.commit()
         return True
@@ -114,24 +161,23 @@ class ExperimentService:
             raise ExperimentNotAccessibleError(
                 f"You are not allowed to edit experiments in project {project_id}"
             )
-        experiments = await self.experiment_repository.get_experiments_by_project(
-            project_id
+        # Every experiment of project_id is covered by the edit permission
+        # checked above, so only membership in the project is validated.
+        project_experiment_ids = set(
+            await self.experiment_repository.get_experiment_ids_by_project(project_id)
         )
+        orders = {}
         for i, experiment_id in enumerate(data):
-            experiment = next(
-                (e for e in experiments if str(e.id) == str(experiment_id)), None
+            # ExperimentReorderDTO already parses UUIDs; only plain strings convert.
+            experiment_uuid = (
+                UUID(experiment_id) if isinstance(experiment_id, str) else experiment_id
             )
-            if not experiment:
+            if experiment_uuid not in project_experiment_ids:
                 raise ExperimentNotAccessibleError(
                     f"Experiment {experiment_id} not found in project {project_id}"
                 )
-            if not await self.permission_checker.can_edit_experiment(
-                user.id, experiment.project_id
-            ):
-                raise ExperimentNotAccessibleError(
-                    f"You are not allowed to edit experiment {experiment_id}"
-                )
-            await self.experiment_repository.update(experiment_id, order=i)
+            orders[experiment_uuid] = i
+        await self.experiment_repository.set_orders(orders)
         await self.db.commit()
         return True
 
@@ -142,7 +188,17 @@ class ExperimentService:
             raise ExperimentNotAccessibleError(
                 f"You are not allowed to view experiments in project {project_id}"
             )
-        experiments = await self.experiment_repository.get_experiments_by_project(
+        experiments = await self.experiment_repository.get_experiment_rows_by_project(
             project_id
         )
         return self.experiment_mapper.experiment_list_schema_to_dto(experiments)
+
+    async def stream_experiments_by_project(
+        self, user: UserProtocol, project_id: UUID_TYPE
+    ) -> AsyncIterator[ExperimentDTO]:
+        # Checked before returning the iterator, as in stream_recent_experiments.
+        if not await self.permission_checker.can_view_experiment(user.id, project_id):
+            raise ExperimentNotAccessibleError(
+                f"You are not allowed to view experiments in project {project_id}"
+            )
+        return self._iter_project_experiments(project_id)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 from typing import Optional
 
@@ -15,28 +16,33 @@ class ExperimentParseResult:
 DEFAULT_EXPERIMENT_NAME_PATTERN = "{num}_from_{parent}_{change}"
 
 
+# Matches a "{field}" placeholder after re.escape() has escaped its braces.
+_ESCAPED_FIELD_RE = re.compile(r"\\\{([^{}\\]+)\\\}")
+
+
+@lru_cache(maxsize=32)
+def _compile_name_pattern(pattern: str) -> re.Pattern[str]:
+    # Convert the pattern like "{num}_from_{parent}_{change}" to regex with named
+    # groups in one substitution over the escaped pattern
+    fields: list[str] = []
+
+    def _group(match: re.Match[str]) -> str:
+        fields.append(match.group(1))
+        return f"(?P<{match.group(1)}>.+?)"
+
+    regex_pattern = _ESCAPED_FIELD_RE.sub(_group, re.escape(pattern))
+    if fields:
+        # For middle fields, be lazy except the last so as to parse correctly
+        head, _, tail = regex_pattern.rpartition(f"(?P<{fields[-1]}>.+?)")
+        regex_pattern = f"{head}(?P<{fields[-1]}>.+){tail}"
+    return re.compile(regex_pattern)
+
+
 def parse_experiment_name(
     name: str, pattern: str, raise_error: bool = True
 ) -> ExperimentParseResult:
-    # Convert the pattern like "{num}_from_{parent}_{change}" to regex with named groups
-    # Find all field names in the curly braces
-    fields = re.findall(r"\{([^{}]+)\}", pattern)
-    # Escape the pattern except {fields}, and replace {field} with named groups
-    regex_pattern = ""
-    last_pos = 0
-    for m in re.finditer(r"\{([^{}]+)\}", pattern):
-        start, end = m.span()
-        # Escape everything between last_pos and start
-        regex_pattern += re.escape(pattern[last_pos:start])
-        field = m.group(1)
-        # For middle fields, be greedy except the last so as to parse correctly
-        if field == fields[-1]:
-            regex_pattern += f"(?P<{field}>.+)"
-        else:
-            regex_pattern += f"(?P<{field}>.+?)"
-        last_pos = end
-    regex_pattern += re.escape(pattern[last_pos:])
-    match = re.fullmatch(regex_pattern, name)
+    # Patterns are per project, so the compiled regex is reused across names.
+    match = _compile_name_pattern(pattern).fullmatch(name)
     if not match:
         # TODO remove this when add several patterns support to select which one to use
         if raise_error:
@@ -7,20 +7,33 @@ from fastapi import APIRouter, Depends, HTTPException
 from api.routes.auth import get_current_user_dual, require_api_token_scopes
 from models import User
 from domain.rbac.permissions import ProjectActions
+from lib.db.error import DBError
+from lib.streaming import STREAM_THRESHOLD, json_array_response
 
 from .dto import HypothesisCreateDTO, HypothesisDTO, HypothesisUpdateDTO
-from .error import HypothesisNotAccessibleError, HypothesisNotFoundError
+from .error import (
+    HypothesisError,
+    HypothesisNotAccessibleError,
+    HypothesisNotFoundError,
+)
 from .service import HypothesisService
 
 router = APIRouter(prefix="/hypotheses", tags=["hypotheses"])
 
 
+# Errors the hypothesis routes translate; anything else is a server error.
+HYPOTHESIS_ROUTE_ERRORS = (HypothesisError, DBError)
+
+_ERROR_STATUS: dict[type[Exception], int] = {
+    HypothesisNotAccessibleError: 403,
+    HypothesisNotFoundError: 404,
+}
+
+
 def _raise_hypothesis_http_error(error: Exception) -> None:
-    if isinstance(error, HypothesisNotAccessibleError):
-        raise HTTPException(status_code=403, detail=str(error))
-    if isinstance(error, HypothesisNotFoundError):
-        raise HTTPException(status_code=404, detail=str(error))
-    raise HTTPException(status_code=400, detail=str(error))
+    raise HTTPException(
+        status_code=_ERROR_STATUS.get(type(error), 400), detail=str(error)
+    )
 
 
 @router.get("/recent", response_model=List[HypothesisDTO])
@@ -31,6 +44,12 @@ async def get_recent_hypotheses(
     _: None = Depends(require_api_token_scopes(ProjectActions.VIEW_HYPOTHESIS)),
     hypothesis_service: HypothesisService = Depends(get_hypothesis_service),
 ):
+    if limit > STREAM_THRESHOLD:
+        return json_array_response(
+            await hypothesis_service.stream_hypotheses_by_project(
+                user, projectId, limit=limit
+            )
+        )
     return await hypothesis_service.get_hypotheses_by_project(
         user, projectId, limit=limit
     )
@@ -47,7 +66,7 @@ async def get_hypothesis(
         return await hypothesis_service.get_hypothesis_if_accessible(
             user, hypothesis_id
         )
-    except Exception as exc:  # noqa: BLE001
+    except HYPOTHESIS_ROUTE_ERRORS as exc:
         _raise_hypothesis_http_error(exc)
 
 
@@ -60,7 +79,7 @@ async def create_hypothesis(
 ):
     try:
         return await hypothesis_service.create_hypothesis(user, data)
-    except Exception as exc:  # noqa: BLE001
+    except HYPOTHESIS_ROUTE_ERRORS as exc:
         _raise_hypothesis_http_error(exc)
 
 
@@ -74,7 +93,7 @@ async def update_hypothesis(
 ):
     try:
         return await hypothesis_service.update_hypothesis(user, hypothesis_id, data)
-    except Exception as exc:  # noqa: BLE001
+    except HYPOTHESIS_ROUTE_ERRORS as exc:
         _raise_hypothesis_http_error(exc)
 
 
@@ -87,7 +106,7 @@ async def delete_hypothesis(
 ):
     try:
         success = await hypothesis_service.delete_hypothesis(user, hypothesis_id)
-    except Exception as exc:  # noqa: BLE001
+    except HYPOTHESIS_ROUTE_ERRORS as exc:
         _raise_hypothesis_http_error(exc)
     if not success:
         raise HTTPException(status_code=404, detail="Hypothesis not found")
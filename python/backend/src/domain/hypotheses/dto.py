@@ -41,4 +41,4 @@ class HypothesisDTO(HypothesisBaseDTO):
     created_at: datetime
     updated_at: datetime
 
-    model_config = model_config()
+    model_config = model_config(trusted=True)
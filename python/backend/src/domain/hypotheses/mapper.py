@@ -1,6 +1,5 @@
 from typing import Any, Dict, List
 
-from lib.dto_converter import DtoConverter
 from .dto import (
     HypothesisCreateDTO,
     HypothesisDTO,
@@ -13,8 +12,9 @@ class HypothesisMapper:
     def __init__(self):
         pass
 
+    # Rows come from the database, so the DTOs are built without re-validation.
     def hypothesis_schema_to_dto(self, hypothesis: Hypothesis) -> HypothesisDTO:
-        return HypothesisDTO(
+        return HypothesisDTO.model_construct(
             id=hypothesis.id,
             project_id=hypothesis.project_id,
             title=hypothesis.title,
@@ -48,19 +48,5 @@ class HypothesisMapper:
     def hypothesis_update_dto_to_update_dict(
         self, hypothesis: HypothesisUpdateDTO
     ) -> Dict[str, Any]:
-        converter = DtoConverter[HypothesisUpdateDTO](HypothesisUpdateDTO)
-        converted_dto = converter.dto_to_partial_dict_with_dto_case(hypothesis)
-        updates: Dict[str, Any] = {}
-        if "title" in converted_dto:
-            updates["title"] = converted_dto["title"]
-        if "description" in converted_dto:
-            updates["description"] = converted_dto["description"]
-        if "author" in converted_dto:
-            updates["author"] = converted_dto["author"]
-        if "status" in converted_dto:
-            updates["status"] = converted_dto["status"]
-        if "target_metrics" in converted_dto:
-            updates["target_metrics"] = converted_dto["target_metrics"]
-        if "baseline" in converted_dto:
-            updates["baseline"] = converted_dto["baseline"]
-        return updates
+        # Only fields the client actually sent; keys match the model columns.
+        return hypothesis.model_dump(exclude_unset=True)
@@ -1,8 +1,9 @@
-from typing import Any, List
+from typing import Any, AsyncIterator, List
 from advanced_alchemy.filters import LimitOffset
 from lib.db.base_repository import BaseRepository
 from lib.types import UUID_TYPE
 from models import Hypothesis
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -25,3 +26,18 @@ class HypothesisRepository(BaseRepository[Hypothesis]):
             order_by=Hypothesis.created_at.desc(),
         )
         return hypotheses
+
+    async def stream_hypotheses_by_project(
+        self, project_id: UUID_TYPE, limit: int | None = None, batch_size: int = 500
+    ) -> AsyncIterator[Hypothesis]:
+        query = (
+            select(Hypothesis)
+            .where(Hypothesis.project_id == project_id)
+            .order_by(Hypothesis.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        if limit:
+            query = query.limit(limit)
+        result = await self.db.stream_scalars(query)
+        async for hypothesis in result:
+            yield hypothesis
@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, List
 
 from domain.projects.errors import ProjectNotAccessibleError
 from domain.projects.service import ProjectService
@@ -15,6 +15,9 @@ from .error import HypothesisNotAccessibleError, HypothesisNotFoundError
 from .mapper import HypothesisMapper
 from .repository import HypothesisRepository
 
+# The mapper is stateless, so every service instance shares one.
+_HYPOTHESIS_MAPPER = HypothesisMapper()
+
 
 class HypothesisService:
     def __init__(
@@ -26,7 +29,7 @@ class HypothesisService:
         self.db = db
         self.hypothesis_repository = hypothesis_repository
         self.permission_checker = permission_checker
-        self.hypothesis_mapper = HypothesisMapper()
+        self.hypothesis_mapper = _HYPOTHESIS_MAPPER
 
     async def get_hypotheses_by_project(
         self, user: UserProtocol, project_id: UUID_TYPE, limit: int | None = None
@@ -38,6 +41,24 @@ class HypothesisService:
         )
         return self.hypothesis_mapper.hypothesis_list_schema_to_dto(hypotheses)
 
+    async def stream_hypotheses_by_project(
+        self, user: UserProtocol, project_id: UUID_TYPE, limit: int | None = None
+    ) -> AsyncIterator[HypothesisDTO]:
+        # Checked before returning the iterator: once streaming starts the
+        # response status can no longer change.
+        if not await self.permission_checker.can_view_hypothesis(user.id, project_id):
+            raise ProjectNotAccessibleError(f"Project {project_id} not accessible")
+        return self._iter_hypotheses_by_project(project_id, limit)
+
+    async def _iter_hypotheses_by_project(
+        self, project_id: UUID_TYPE, limit: int | None
+    ) -> AsyncIterator[HypothesisDTO]:
+        rows = self.hypothesis_repository.stream_hypotheses_by_project(
+            project_id, limit
+        )
+        async for hypothesis in rows:
+            yield self.hypothesis_mapper.hypothesis_schema_to_dto(hypothesis)
+
     async def get_hypothesis_if_accessible(
         self, user: UserProtocol, hypothesis_id: UUID_TYPE
     ) -> HypothesisDTO:
@@ -1,4 +1,6 @@
 from api.routes.service_dependencies import get_metric_service
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException
 
 from api.routes.auth import get_current_user_dual, require_api_token_scopes
@@ -33,4 +35,17 @@ async def create_metric(
         _raise_metric_http_error(exc)
 
 
+@router.post("/batch", response_model=List[MetricDTO])
+async def create_metrics(
+    data: List[MetricCreateDTO],
+    user: User = Depends(get_current_user_dual),
+    _: None = Depends(require_api_token_scopes(ProjectActions.CREATE_METRIC)),
+    metric_service: MetricService = Depends(get_metric_service),
+):
+    try:
+        return await metric_service.create_metrics(user, data)
+    except Exception as exc:  # noqa: BLE001
+        _raise_metric_http_error(exc)
+
+
 # TODO: implement service methods for additional metric routes if added.
@@ -1,6 +1,6 @@
 from typing import Any, Dict, Iterable, List
 
-from lib.dto_converter import DtoConverter
+from lib.dto_converter import get_dto_converter
 from models import Metric as MetricModel
 
 from .dto import MetricDTO
@@ -26,7 +26,7 @@ class MetricMapper:
         )
 
     def metric_update_dto_to_update_dict(self, data: MetricUpdateDTO) -> Dict[str, Any]:
-        converter = DtoConverter[MetricUpdateDTO](MetricUpdateDTO)
+        converter = get_dto_converter(MetricUpdateDTO)
         converted_dto = converter.dto_to_partial_dict_with_dto_case(data)
         updates: Dict[str, Any] = {}
         if "name" in converted_dto:
@@ -1,19 +1,48 @@
+import uuid
+
 from domain.projects.repository import ProjectRepository
 from lib.protocols.user_protocol import UserProtocol
 from lib.db.base_repository import BaseRepository
-from models import Metric
+from models import Metric, utc_now
 from sqlalchemy.ext.asyncio import AsyncSession
 from lib.types import UUID_TYPE
 from domain.experiments.repository import ExperimentRepository
+from db.database import bulk_copy
 from typing import List
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
+# Batches above this size go through COPY on asyncpg instead of ORM inserts.
+COPY_THRESHOLD = 100
+
+_COPY_COLUMNS = ("id", "experiment_id", "name", "value", "step", "label", "created_at")
+
 
 class MetricRepository(BaseRepository[Metric]):
     def __init__(self, db: AsyncSession):
         super().__init__(db, Metric)
 
+    async def create_many(self, metrics: List[Metric]) -> List[Metric]:
+        if len(metrics) > COPY_THRESHOLD and self.db.bind.dialect.driver == "asyncpg":
+            # COPY bypasses the ORM, so fill the client-side defaults ourselves.
+            for metric in metrics:
+                metric.id = metric.id or uuid.uuid4()
+                metric.step = metric.step or 0
+                metric.created_at = metric.created_at or utc_now()
+            await bulk_copy(
+                self.db,
+                Metric.__tablename__,
+                _COPY_COLUMNS,
+                (
+                    tuple(getattr(metric, column) for column in _COPY_COLUMNS)
+                    for metric in metrics
+                ),
+            )
+            return metrics
+        self.db.add_all(metrics)
+        await self.db.flush()
+        return metrics
+
     async def get_metrics_by_experiment(
         self,
         experiment_id: UUID_TYPE | list[UUID_TYPE],
@@ -1,4 +1,5 @@
 from typing import Dict, Iterable, List
+from uuid import UUID
 
 from domain.experiments.repository import ExperimentRepository
 from domain.rbac.wrapper import PermissionChecker
@@ -79,6 +80,26 @@ class MetricService:
         await self.db.commit()
         return self.metric_mapper.metric_schema_to_dto(metric)
 
+    async def create_metrics(
+        self, user: UserProtocol, data: List[MetricCreateDTO]
+    ) -> List[MetricDTO]:
+        # Body ids may arrive as str; the lookup below is keyed by UUID.
+        experiment_ids = {UUID(str(item.experiment_id)) for item in data}
+        # One IN query for every experiment in the batch instead of one each.
+        project_by_experiment = await self.experiment_repository.get_project_ids(
+            list(experiment_ids)
+        )
+        for experiment_id in experiment_ids:
+            if experiment_id not in project_by_experiment:
+                raise MetricNotFoundError(f"Experiment {experiment_id} not found")
+        for project_id in set(project_by_experiment.values()):
+            if not await self.permission_checker.can_create_metric(user.id, project_id):
+                raise MetricNotAccessibleError(f"Project {project_id} not accessible")
+        metrics = [self.metric_mapper.metric_create_dto_to_schema(item) for item in data]
+        await self.metric_repository.create_many(metrics)
+        await self.db.commit()
+        return self.metric_mapper.metric_list_schema_to_dto(metrics)
+
     async def update_metric(
         self, user: UserProtocol, metric_id: UUID_TYPE, data: MetricUpdateDTO
     ) -> MetricDTO:
@@ -14,6 +14,8 @@ from models import User
 
 router = APIRouter(tags=["object_storage"])
 
+OBJECT_STORAGE_SERVICE_URL = get_settings().object_storage_service_url
+
 
 def _raise_object_storage_error(error: Exception) -> None:
     if isinstance(error, httpx.HTTPStatusError):
@@ -30,7 +32,7 @@ async def check_blobs(
     hashes: list[str] = Body(..., embed=False),
     _user: User = Depends(get_current_user_dual),
 ):
-    client = ObjectStorageClient(get_settings().object_storage_service_url)
+    client = ObjectStorageClient(OBJECT_STORAGE_SERVICE_URL)
     try:
         result = await client.check_blobs(hashes)
         return BlobCheckResponseDTO.model_validate(result)
@@ -44,7 +46,7 @@ async def upload_blob(
     file: UploadFile = File(...),
     _user: User = Depends(get_current_user_dual),
 ):
-    client = ObjectStorageClient(get_settings().object_storage_service_url)
+    client = ObjectStorageClient(OBJECT_STORAGE_SERVICE_URL)
     try:
         return await client.upload_blob(hash, file)
     except Exception as exc:  # noqa: BLE001
@@ -56,7 +58,7 @@ async def create_snapshot(
     payload: SnapshotCreateRequestDTO,
     _user: User = Depends(get_current_user_dual),
 ):
-    client = ObjectStorageClient(get_settings().object_storage_service_url)
+    client = ObjectStorageClient(OBJECT_STORAGE_SERVICE_URL)
     try:
         result = await client.create_snapshot(payload.model_dump())
         return SnapshotCreateResponseDTO.model_validate(result)
@@ -69,7 +71,7 @@ async def download_snapshot(
     snapshot_id: str,
     _user: User = Depends(get_current_user_dual),
 ):
-    base_url = get_settings().object_storage_service_url.rstrip("/")
+    base_url = OBJECT_STORAGE_SERVICE_URL.rstrip("/")
     client = httpx.AsyncClient(timeout=None)
     try:
         response = await client.get(
@@ -9,11 +9,12 @@ from domain.metrics.dto import MetricDTO as MetricDTO
 from domain.metrics.service import MetricService
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.routes.auth import get_current_user_dual, require_api_token_scopes
 from db.database import get_async_session
+from lib.streaming import json_array_response
 from models import User
 from domain.rbac.permissions import ProjectActions
 from domain.rbac.permissions.team import TeamActions
@@ -61,10 +62,19 @@ async def get_all_projects(
 async def get_project_experiments(
     project_id: UUID,
     user: User = Depends(get_current_user_dual),
+    stream: bool = Query(
+        False, description="Stream the array instead of building it in memory"
+    ),
     _: None = Depends(require_api_token_scopes(ProjectActions.VIEW_EXPERIMENT)),
     experiment_service: ExperimentService = Depends(get_experiment_service),
 ):
     try:
+        if stream:
+            return json_array_response(
+                await experiment_service.stream_experiments_by_project(
+                    user, project_id
+                )
+            )
         return await experiment_service.get_experiments_by_project(user, project_id)
     except Exception as exc:  # noqa: BLE001
         _raise_project_http_error(exc)
@@ -74,10 +84,19 @@ async def get_project_experiments(
 async def get_project_hypotheses(
     project_id: UUID,
     user: User = Depends(get_current_user_dual),
+    stream: bool = Query(
+        False, description="Stream the array instead of building it in memory"
+    ),
     _: None = Depends(require_api_token_scopes(ProjectActions.VIEW_HYPOTHESIS)),
     hypothesis_service: HypothesisService = Depends(get_hypothesis_service),
 ):
     try:
+        if stream:
+            return json_array_response(
+                await hypothesis_service.stream_hypotheses_by_project(
+                    user, project_id
+                )
+            )
         return await hypothesis_service.get_hypotheses_by_project(user, project_id)
     except Exception as exc:  # noqa: BLE001
         _raise_project_http_error(exc)
@@ -7,7 +7,7 @@ from domain.projects.dto import (
     ProjectUpdateDTO,
 )
 from domain.projects.utils import default_metrics
-from lib.dto_converter import DtoConverter
+from lib.dto_converter import get_dto_converter
 from models import Project
 from typing import List, Optional, Sequence, Dict, Any
 from uuid import UUID
@@ -83,7 +83,7 @@ class ProjectMapper:
     ) -> Project:
         """Convert ProjectCreateDTO to Project model"""
         # Convert metrics from Pydantic models to dicts
-        converter = DtoConverter[ProjectCreateDTO](ProjectCreateDTO)
+        converter = get_dto_converter(ProjectCreateDTO)
         metrics: List[Dict[str, Any]] = []
         if dto.metrics:
             metrics = [converter.dto_to_dict_with_dto_case(m) for m in dto.metrics]
@@ -112,7 +112,7 @@ class ProjectMapper:
         Convert ProjectUpdateDTO to a dictionary of updates for repository.update()
         Only includes fields that are actually provided (not None)
         """
-        converter = DtoConverter[ProjectUpdateDTO](ProjectUpdateDTO)
+        converter = get_dto_converter(ProjectUpdateDTO)
         converted_dto = converter.dto_to_partial_dict_with_dto_case(dto)
         updates = {}
         if "name" in converted_dto:
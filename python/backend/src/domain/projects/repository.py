@@ -1,7 +1,10 @@
 from typing import List
+from uuid import UUID
 from lib.db.base_repository import BaseRepository
+from lib.db.error import DBNotFoundError
 from lib.types import UUID_TYPE
 from models import Project
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -27,6 +30,17 @@ class ProjectRepository(BaseRepository):
             Project.id == project_id, load=self._load_options(full_load)
         )
 
+    async def get_team_id(self, project_id: UUID_TYPE) -> UUID | None:
+        """Return the project's team id, raising DBNotFoundError if it does not exist."""
+        result = await self.db.execute(
+            select(Project.team_id).where(Project.id == project_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise DBNotFoundError(f"Object with id {project_id} not found")
+        team_id: UUID | None = row.team_id
+        return team_id
+
     async def get_projects_by_ids(
         self, project_ids: List[UUID_TYPE], full_load: bool = True
     ) -> List[Project]:
@@ -2,11 +2,11 @@
 from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from lib.db.base_repository import BaseRepository
-from models import Permission
+from models import Permission, Project
 
 from .error import InvalidIdError, InvalidScopeError
 
@@ -146,6 +146,34 @@ class PermissionRepository(BaseRepository[Permission]):
             if permission_id is not None
         ]
 
+    async def get_user_accessible_project_ids(
+        self, user_id: UUID, actions: list[str] | str | None = None
+    ) -> list[UUID]:
+        """
+        Return ids of projects the user is allowed on directly or through a team.
+
+        Both permission lookups are IN-subqueries of a single statement.
+        """
+        conditions = [Permission.user_id == user_id, Permission.allowed.is_(True)]
+        normalized_actions = self._normalize_actions(actions)
+        if normalized_actions is not None:
+            conditions.append(Permission.action.in_(normalized_actions))
+        project_permissions = select(Permission.project_id).where(
+            Permission.project_id.is_not(None), *conditions
+        )
+        team_permissions = select(Permission.team_id).where(
+            Permission.team_id.is_not(None), *conditions
+        )
+        result = await self.db.execute(
+            select(Project.id).where(
+                or_(
+                    Project.id.in_(project_permissions),
+                    Project.team_id.in_(team_permissions),
+                )
+            )
+        )
+        return list(result.scalars().all())
+
     async def get_user_projects_exists_permissions_ids(
         self, user_id: UUID, actions: list[str] | str | None = None
     ) -> list[UUID]:
@@ -38,6 +38,37 @@ class PermissionService:
         self.repo = permission_repository
         self.project_repo = project_repository
         self.auto_commit = auto_commit
+        # Team ids per (user, actions) for the lifetime of this service, which
+        # is one request; cleared whenever permissions change.
+        self._team_ids_cache: Dict[tuple, List[UUID]] = {}
+        self._project_team_ids: Dict[UUID, Optional[UUID]] = {}
+        # has_permission verdicts and accessible project ids, same lifetime
+        # and invalidation as above.
+        self._verdict_cache: Dict[tuple, bool] = {}
+        self._project_ids_cache: Dict[tuple, List[UUID]] = {}
+
+    @staticmethod
+    def _actions_key(actions: list[str] | str | None) -> str | tuple | None:
+        if actions is None or isinstance(actions, str):
+            return actions
+        return tuple(sorted(actions))
+
+    def _clear_caches(self) -> None:
+        self._team_ids_cache.clear()
+        self._verdict_cache.clear()
+        self._project_ids_cache.clear()
+
+    async def _get_team_ids(
+        self, user_id: UUID, actions: list[str] | str | None
+    ) -> List[UUID]:
+        key = (user_id, self._actions_key(actions))
+        team_ids = self._team_ids_cache.get(key)
+        if team_ids is None:
+            team_ids = await self.repo.get_user_accessible_teams_ids(
+                user_id, actions=actions
+            )
+            self._team_ids_cache[key] = team_ids
+        return list(team_ids)
 
     async def add_permission(
         self,
@@ -48,6 +79,7 @@ class PermissionService:
         project_id: UUID | None = None,
     ) -> None:
         """Create a new permission scoped to a team or project."""
+        self._clear_caches()
         await self.repo.create_permission(
             Permission(
                 user_id=user_id,
@@ -87,6 +119,10 @@ class PermissionService:
             ]
         )
 
+    def remember_project_team(self, project_id: UUID, team_id: UUID | None) -> None:
+        """Record a project's team id already loaded by the caller."""
+        self._project_team_ids[project_id] = team_id
+
     async def has_permission(
         self,
         user_id: UUID,
@@ -115,6 +151,22 @@ class PermissionService:
             raise InvalidScopeError(
                 "Only one of project_id or team_id can be provided."
             )
+        key = (user_id, self._actions_key(actions), team_id, project_id)
+        verdict = self._verdict_cache.get(key)
+        if verdict is None:
+            verdict = await self._resolve_permission(
+                user_id, actions, team_id, project_id
+            )
+            self._verdict_cache[key] = verdict
+        return verdict
+
+    async def _resolve_permission(
+        self,
+        user_id: UUID,
+        actions: str | list[str] | None,
+        team_id: UUID | None,
+        project_id: UUID | None,
+    ) -> bool:
         if project_id is None:
             permissions = await self.repo.get_permissions(
                 user_id=user_id, team_id=team_id, project_id=None, actions=actions
@@ -127,12 +179,17 @@ class PermissionService:
         if project_permissions:
             return any(permission.allowed for permission in project_permissions)
 
-        project = await self.project_repo.get_by_id(project_id)
-        if project.team_id is None:
+        team_id = self._project_team_ids.get(project_id)
+        if team_id is None and project_id not in self._project_team_ids:
+            # Only the owning team matters here; a project's team is looked up
+            # once per service however many actions are checked against it.
+            team_id = await self.project_repo.get_team_id(project_id)
+            self._project_team_ids[project_id] = team_id
+        if team_id is None:
             return False
 
         team_permissions = await self.repo.get_permissions(
-            user_id=user_id, team_id=project.team_id, actions=actions
+            user_id=user_id, team_id=team_id, actions=actions
         )
         return any(permission.allowed for permission in team_permissions)
 
@@ -140,24 +197,20 @@ class PermissionService:
         self, user_id: UUID, actions: list[str] | str | None = None
     ) -> list[UUID]:
         """Return project ids accessible via permissions or team permissions."""
-        project_ids = set(
-            await self.repo.get_user_projects_exists_permissions_ids(
+        key = (user_id, self._actions_key(actions))
+        project_ids = self._project_ids_cache.get(key)
+        if project_ids is None:
+            project_ids = await self.repo.get_user_accessible_project_ids(
                 user_id, actions=actions
             )
-        )
-        team_ids = await self.repo.get_user_accessible_teams_ids(
-            user_id, actions=actions
-        )
-        for team_id in team_ids:
-            projects = await self.project_repo.get_projects_by_team(team_id=team_id)
-            project_ids.update(project.id for project in projects)
+            self._project_ids_cache[key] = project_ids
         return list(project_ids)
 
     async def get_user_accessible_team_ids(
         self, user_id: UUID, actions: list[str] | str | None = None
     ) -> list[UUID]:
         """Return team ids where the user has allowed permissions."""
-        return await self.repo.get_user_accessible_teams_ids(user_id, actions=actions)
+        return await self._get_team_ids(user_id, actions)
 
     # Team permissions
     async def add_user_to_team_permissions(
@@ -168,6 +221,7 @@ class PermissionService:
         This creates both team permissions and project permissions so that
         team membership also grants project-level actions by default.
         """
+        self._clear_caches()
         # Combine team and project permissions which is default behavior for team members
         team_permissions = role_to_team_permissions(role) | role_to_project_permissions(
             role
@@ -199,6 +253,7 @@ class PermissionService:
         self, user_id: UUID, team_id: UUID
     ) -> None:
         """Remove all team-scoped permissions and related project permissions."""
+        self._clear_caches()
         permissions = await self.repo.get_permissions(user_id=user_id, team_id=team_id)
         await self.repo.delete_permission(permissions)
 
@@ -216,6 +271,7 @@ class PermissionService:
         self, user_id: UUID, team_id: UUID, role: Role
     ) -> None:
         """Update team and project permissions for a team member role."""
+        self._clear_caches()
         permissions = await self.repo.get_permissions(user_id=user_id, team_id=team_id)
         new_permissions = role_to_team_permissions(role) | role_to_project_permissions(
             role
@@ -232,6 +288,7 @@ class PermissionService:
         self, user_id: UUID, project_id: UUID, role: Role
     ) -> None:
         """Grant project-scoped permissions for a role."""
+        self._clear_caches()
         project_permissions = role_to_project_permissions(role)
         existing_permissions = await self.repo.get_permissions(
             user_id=user_id, project_id=project_id
@@ -260,6 +317,7 @@ class PermissionService:
         self, user_id: UUID, project_id: UUID
     ) -> None:
         """Remove all project-scoped permissions for a user."""
+        self._clear_caches()
         permissions = await self.repo.get_permissions(
             user_id=user_id, project_id=project_id
         )
@@ -271,6 +329,7 @@ class PermissionService:
         self, user_id: UUID, project_id: UUID, role: Role
     ) -> None:
         """Update project-scoped permissions for a user role."""
+        self._clear_caches()
         permissions = await self.repo.get_permissions(
             user_id=user_id, project_id=project_id
         )
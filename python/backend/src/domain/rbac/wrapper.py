@@ -11,6 +11,10 @@ class PermissionChecker:
         """Initialize with a permission service."""
         self.permission_service = permission_service
 
+    def remember_project_team(self, project_id: UUID, team_id: UUID | None) -> None:
+        """Let later project checks skip looking up the project's team."""
+        self.permission_service.remember_project_team(project_id, team_id)
+
     # Project-scoped permissions
     async def can_edit_project(self, user_id: UUID, project_id: UUID) -> bool:
         """Return whether the user can edit a project."""
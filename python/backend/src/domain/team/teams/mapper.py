@@ -10,7 +10,7 @@ from domain.team.teams.dto import (
     TeamMemberReadDTO,
 )
 from models import Team, TeamMember
-from lib.dto_converter import DtoConverter
+from lib.dto_converter import get_dto_converter
 
 
 @dataclass
@@ -39,7 +39,7 @@ class TeamMapper:
         )
 
     def team_update_dto_to_dict(self, dto: TeamUpdateDTO) -> Dict[str, Any]:
-        converter = DtoConverter[TeamUpdateDTO](TeamUpdateDTO)
+        converter = get_dto_converter(TeamUpdateDTO)
         return converter.dto_to_partial_dict_with_dto_case(dto)
 
     # Team Member
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence
 from uuid import UUID
 from domain.team.teams.errors import TeamMemberNotFoundError
 from lib.db.base_repository import BaseRepository
@@ -18,7 +18,7 @@ class TeamRepository(BaseRepository[Team]):
         )
 
     async def create(self, obj: Team) -> Team:
-        return await self.advanced_alchemy_repository.add(obj, auto_refresh=True)
+        return await self.advanced_alchemy_repository.add(obj, auto_refresh=False)
 
     async def update(self, id: str | UUID, **kwargs) -> Team:
         if "id" in kwargs:
@@ -32,7 +32,7 @@ class TeamRepository(BaseRepository[Team]):
         return await self.advanced_alchemy_repository.delete(id)
 
     async def add_team_member(self, member: TeamMember) -> TeamMember:
-        return await self.team_member_repository.add(member, auto_refresh=True)
+        return await self.team_member_repository.add(member, auto_refresh=False)
 
     async def update_team_member(self, member: TeamMember) -> TeamMember:
         return await self.team_member_repository.update(member, auto_refresh=True)
@@ -48,15 +48,14 @@ class TeamRepository(BaseRepository[Team]):
             raise TeamMemberNotFoundError("Team member not found")
         await self.team_member_repository.delete(team_member.id)
 
-    async def get_accessible_teams(self, user: User) -> List[Team]:
+    async def get_accessible_teams(self, user: User) -> Sequence[Team]:
         query = (
             select(Team)
             .join(TeamMember, Team.id == TeamMember.team_id)
             .where(TeamMember.user_id == user.id)
         )
         result = await self.db.execute(query)
-        teams = result.scalars().all()
-        return list(teams)
+        return result.scalars().all()
 
     async def get_teams_by_ids(self, team_ids: List[UUID_TYPE]) -> List[Team]:
         if not team_ids:
@@ -66,7 +66,8 @@ class BaseRepository(Generic[T]):
         return repo
 
     async def create(self, obj: T) -> T:
-        return await self.advanced_alchemy_repository.add(obj, auto_refresh=True)
+        # The flush already populates defaults (eager_defaults), so skip the refresh SELECT.
+        return await self.advanced_alchemy_repository.add(obj, auto_refresh=False)
 
     async def update(self, id: str | UUID, **kwargs) -> T:
         # Convert string UUID to UUID object if needed for proper comparison
@@ -2,7 +2,16 @@ from pydantic import ConfigDict, AliasGenerator
 from pydantic.alias_generators import to_camel
 
 
-def model_config() -> ConfigDict:
+def model_config(trusted: bool = False) -> ConfigDict:
+    # Trusted DTOs are built by the server from database rows: they are
+    # immutable, read ORM attributes and compile their schema on first use.
+    if trusted:
+        return ConfigDict(
+            **model_config(),
+            frozen=True,
+            defer_build=True,
+            from_attributes=True,
+        )
     return ConfigDict(
         alias_generator=AliasGenerator(
             validation_alias=to_camel,  # Input: FirstName -> first_name
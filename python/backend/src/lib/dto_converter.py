@@ -1,4 +1,5 @@
-from typing import Any, Type
+from functools import lru_cache
+from typing import Any, Type, TypeVar
 from pydantic import BaseModel
 
 
@@ -71,3 +72,12 @@ class DtoConverter[T: BaseModel]:
             return dto.model_dump(by_alias=False, mode="json", exclude_unset=True)
         else:
             return dict(dto)
+
+
+DtoT = TypeVar("DtoT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def get_dto_converter(dto_type: Type[DtoT]) -> DtoConverter[DtoT]:
+    """Return the shared converter for ``dto_type``; converters hold no state."""
+    return DtoConverter(dto_type)
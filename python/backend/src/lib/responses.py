@@ -0,0 +1,17 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response encoded by pydantic-core instead of the stdlib ``json`` module.
+
+    pydantic-core is already a dependency and serializes UUIDs and datetimes
+    natively in Rust, so this gives orjson-class encoding speed without
+    adding another package.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
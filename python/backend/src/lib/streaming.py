@@ -0,0 +1,31 @@
+from typing import AsyncIterable, AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+# List routes stream their result row by row instead of building it in memory
+# once it may hold more than this many items.
+STREAM_THRESHOLD = 50
+
+
+async def iter_json_array(items: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    """Encode ``items`` as a JSON array one element at a time (camelCase aliases)."""
+    yield b"["
+    first = True
+    async for item in items:
+        if not first:
+            yield b","
+        first = False
+        yield item.model_dump_json(by_alias=True).encode("utf-8")
+    yield b"]"
+
+
+def json_array_response(items: AsyncIterable[BaseModel]) -> StreamingResponse:
+    """
+    Stream ``items`` as a JSON array.
+
+    ``items`` usually reads from the request-scoped session while the body is
+    sent. FastAPI only closes yield dependencies after the response since
+    0.118, which is why pyproject.toml requires at least that version.
+    """
+    return StreamingResponse(iter_json_array(items), media_type="application/json")
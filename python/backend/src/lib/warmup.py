@@ -0,0 +1,39 @@
+from typing import Any, Iterator, get_args
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+
+def _models_in(annotation: Any) -> Iterator[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _models_in(arg)
+
+
+def warm_up_models(app: FastAPI) -> int:
+    """
+    Build the validators and serializers of every route DTO that is still deferred.
+
+    FastAPI compiles the field adapters of each route when it is registered, but
+    models declared with ``defer_build`` keep their own validator and serializer
+    unbuilt until first use, which would otherwise happen inside a request.
+
+    Returns:
+        int: Number of models built.
+    """
+    models: set[type[BaseModel]] = set()
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        models.update(_models_in(route.response_model))
+        if route.body_field is not None:
+            models.update(_models_in(route.body_field.field_info.annotation))
+
+    built = 0
+    for model in models:
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+            built += 1
+    return built
@@ -36,6 +36,9 @@ class Base(DeclarativeBase):
 
 class UUIDBase(Base, AdvancedUUIDBase):
     __abstract__ = True
+    # Fetch any server-generated values in the INSERT's RETURNING clause
+    # instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
@@ -144,6 +147,10 @@ class ApiToken(UUIDBase):
         "User", back_populates="api_tokens", lazy="raise"
     )
 
+    # Serves list_by_user (WHERE user_id ORDER BY created_at DESC) with a
+    # backward index scan instead of a sort.
+    __table_args__ = (Index("ix_api_tokens_user_created", user_id, created_at),)
+
 
 class Team(UUIDBase):
     __tablename__ = "teams"
@@ -156,7 +163,7 @@ class Team(UUIDBase):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
 
     owner: Mapped["User"] = relationship(
-        "User", back_populates="owned_teams", foreign_keys=[owner_id]
+        "User", back_populates="owned_teams", foreign_keys=[owner_id], lazy="raise"
     )
     member_links: Mapped[List["TeamMember"]] = relationship(
         "TeamMember",
@@ -264,6 +271,19 @@ class Experiment(UUIDBase):
         lazy="raise",
     )
 
+    __table_args__ = (
+        Index(
+            "ix_experiments_tags_gin",
+            tags,
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        # Per-project listings and reorders, ordered by the user-defined order.
+        Index("ix_experiments_project_order", project_id, order),
+        # get_user_experiments: WHERE started_by ORDER BY created_at DESC.
+        Index("ix_experiments_started_by_created", started_by, created_at),
+    )
+
 
 class Hypothesis(UUIDBase):
     __tablename__ = "hypotheses"
@@ -290,6 +310,9 @@ class Hypothesis(UUIDBase):
         "Project", back_populates="hypotheses", lazy="raise"
     )
 
+    # get_hypotheses_by_project: WHERE project_id ORDER BY created_at DESC.
+    __table_args__ = (Index("ix_hypotheses_project_created", project_id, created_at),)
+
 
 class Metric(UUIDBase):
     __tablename__ = "metrics"
@@ -11,7 +11,8 @@ from domain.api_tokens.controller import router as api_tokens_router
 from domain.projects.controller import router as projects_router
 from domain.rbac.permissions import ProjectActions
 from domain.rbac.service import PermissionService
-from models import Project, Role, User
+from lib.streaming import STREAM_THRESHOLD
+from models import ApiToken, Project, Role, User
 
 
 def create_test_app() -> FastAPI:
@@ -121,6 +122,29 @@ async def test_list_tokens_returns_list_item_dto_fields(
     assert "token" not in token
 
 
+@pytest.mark.asyncio
+async def test_list_tokens_streams_long_lists(
+    client: TestClient, db_session: AsyncSession, test_user: User
+):
+    count = STREAM_THRESHOLD + 5
+    db_session.add_all(
+        ApiToken(
+            user_id=test_user.id,
+            token_hash=f"hash_{index}",
+            name=f"Token {index}",
+            scopes=[ProjectActions.VIEW_PROJECT],
+        )
+        for index in range(count)
+    )
+    await db_session.flush()
+
+    list_response = client.get("/users/me/api-tokens")
+    assert list_response.status_code == 200
+    tokens = list_response.json()
+    assert len(tokens) == count
+    assert "token" not in tokens[0]
+
+
 @pytest.mark.asyncio
 async def test_pat_auth_access_projects(
     client: TestClient, db_session: AsyncSession, test_user: User
@@ -1,4 +1,7 @@
+import time
+from contextlib import asynccontextmanager
 from datetime import timedelta
+from uuid import uuid4
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,12 +11,16 @@ from domain.api_tokens.error import (
     ApiTokenInvalidError,
     ApiTokenRevokedError,
 )
+from domain.api_tokens.repository import ApiTokenRepository
 from domain.api_tokens.service import (
     ApiTokenService,
+    CachedToken,
+    LastUsedBatcher,
     TOKEN_CACHE,
+    TokenCache,
     hash_token,
 )
-from models import User, utc_now
+from models import ApiToken, User, utc_now
 
 
 @pytest.fixture(autouse=True)
@@ -26,7 +33,7 @@ def clear_token_cache() -> None:
 class TestApiTokenService:
     @pytest.fixture
     def api_token_service(self, db_session: AsyncSession) -> ApiTokenService:
-        return ApiTokenService(db_session)
+        return ApiTokenService(db_session, ApiTokenRepository(db_session))
 
     async def test_create_token_returns_dto(
         self, api_token_service: ApiTokenService, test_user: User
@@ -111,6 +118,23 @@ class TestApiTokenService:
 
         assert revoked.revoked is True
 
+    async def test_revoke_token_rejects_next_validation(
+        self, api_token_service: ApiTokenService, test_user: User
+    ) -> None:
+        created = await api_token_service.create_token(
+            user_id=test_user.id,
+            name="Cached token",
+            description=None,
+            scopes=[],
+            expires_in_days=None,
+        )
+        await api_token_service.validate_token(created.token)
+
+        await api_token_service.revoke_token(test_user.id, created.id)
+
+        with pytest.raises(ApiTokenRevokedError):
+            await api_token_service.validate_token(created.token)
+
     async def test_validate_token_raises_for_invalid(self, api_token_service) -> None:
         with pytest.raises(ApiTokenInvalidError):
             await api_token_service.validate_token("pat_invalid")
@@ -168,3 +192,79 @@ class TestApiTokenService:
         token = await api_token_service.repo.get_by_id(created.id, test_user.id)
         assert token is not None
         assert token.last_used_at is not None
+
+
+def _cached_token(ttl_seconds: int = 60) -> CachedToken:
+    token = ApiToken(id=uuid4(), user_id=uuid4(), token_hash="hash", name="Cached")
+    return CachedToken(
+        token_id=token.id,
+        user_id=token.user_id,
+        scopes=frozenset(),
+        expires_at=None,
+        revoked=False,
+        expires_at_ns=time.monotonic_ns() + ttl_seconds * 1_000_000_000,
+        token=token,
+    )
+
+
+class TestTokenCache:
+    def test_evicts_least_recently_used(self) -> None:
+        cache = TokenCache(maxsize=2)
+        first, second, third = (TokenCache.key(f"pat_{i}") for i in range(3))
+        cache.set(first, _cached_token())
+        cache.set(second, _cached_token())
+        assert cache.get(first) is not None
+
+        cache.set(third, _cached_token())
+
+        assert cache.get(first) is not None
+        assert cache.get(second) is None
+        assert cache.get(third) is not None
+
+    def test_expired_entry_is_dropped(self) -> None:
+        cache = TokenCache()
+        key = TokenCache.key("pat_expired")
+        cache.set(key, _cached_token(ttl_seconds=-1))
+
+        assert cache.get(key) is None
+
+    def test_invalidate_token_by_id(self) -> None:
+        cache = TokenCache()
+        key = TokenCache.key("pat_revoked")
+        cached = _cached_token()
+        cache.set(key, cached)
+
+        cache.invalidate_token(cached.token_id)
+
+        assert cache.get(key) is None
+
+
+class TestLastUsedBatcher:
+    async def test_flush_writes_latest_timestamp_per_token(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        tokens = [
+            ApiToken(user_id=test_user.id, token_hash=f"hash-{i}", name=f"Token {i}")
+            for i in range(2)
+        ]
+        db_session.add_all(tokens)
+        await db_session.flush()
+
+        @asynccontextmanager
+        async def session_factory():
+            yield db_session
+
+        batcher = LastUsedBatcher()
+        batcher._session_factory = session_factory
+        earlier = utc_now() - timedelta(minutes=5)
+        later = utc_now()
+        batcher.record(tokens[0].id, earlier)
+        batcher.record(tokens[0].id, later)
+        batcher.record(tokens[1].id, earlier)
+
+        await batcher.flush()
+
+        for token in tokens:
+            await db_session.refresh(token)
+        assert tokens[0].last_used_at == later
+        assert tokens[1].last_used_at == earlier
@@ -4,7 +4,8 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from domain.experiments.repository import ExperimentRepository
+from domain.experiments.repository import DTO_COLUMNS, ExperimentRepository
+from lib.db.error import DBNotFoundError
 from models import Experiment, ExperimentStatus, Project, User
 
 
@@ -67,3 +68,123 @@ class TestExperimentRepository:
         names = {experiment.name for experiment in experiments}
 
         assert names == {"E1", "E2"}
+
+    async def test_get_experiment_rows_by_project(
+        self,
+        experiment_repository: ExperimentRepository,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        project = await _create_project(db_session, test_user)
+        other_project = await _create_project(db_session, test_user)
+        experiment = await _create_experiment(db_session, project, name="E1")
+        await _create_experiment(db_session, other_project, name="Other")
+
+        rows = await experiment_repository.get_experiment_rows_by_project(project.id)
+
+        assert [(row.id, row.name) for row in rows] == [(experiment.id, "E1")]
+        assert set(rows[0]._fields) == {column.key for column in DTO_COLUMNS}
+
+    async def test_stream_latest_experiments_orders_and_limits(
+        self,
+        experiment_repository: ExperimentRepository,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        project = await _create_project(db_session, test_user)
+        for day in range(1, 4):
+            await _create_experiment(
+                db_session, project, name=f"E{day}", created_at=datetime(2024, 1, day)
+            )
+
+        names = [
+            experiment.name
+            async for experiment in experiment_repository.stream_latest_experiments(
+                project.id, limit=2
+            )
+        ]
+
+        assert names == ["E3", "E2"]
+
+    async def test_set_orders_updates_each_experiment(
+        self,
+        experiment_repository: ExperimentRepository,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        project = await _create_project(db_session, test_user)
+        first = await _create_experiment(db_session, project, name="E1")
+        second = await _create_experiment(db_session, project, name="E2")
+
+        await experiment_repository.set_orders({first.id: 1, second.id: 0})
+
+        await db_session.refresh(first)
+        await db_session.refresh(second)
+        assert (first.order, second.order) == (1, 0)
+
+    async def test_get_project_id(
+        self,
+        experiment_repository: ExperimentRepository,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        project = await _create_project(db_session, test_user)
+        experiment = await _create_experiment(db_session, project, name="E1")
+
+        assert await experiment_repository.get_project_id(experiment.id) == project.id
+        assert await experiment_repository.get_project_id(uuid4()) is None
+
+    async def test_get_with_team_id(
+        self,
+        experiment_repository: ExperimentRepository,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        project = await _create_project(db_session, test_user)
+        experiment = await _create_experiment(db_session, project, name="E1")
+
+        loaded, team_id = await experiment_repository.get_with_team_id(experiment.id)
+
+        assert loaded.id == experiment.id
+        assert team_id is None
+        with pytest.raises(DBNotFoundError):
+            await experiment_repository.get_with_team_id(uuid4())
+
+    async def test_get_project_ids(
+        self,
+        experiment_repository: ExperimentRepository,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        project = await _create_project(db_session, test_user)
+        other_project = await _create_project(db_session, test_user)
+        experiment = await _create_experiment(db_session, project, name="E1")
+        other = await _create_experiment(db_session, other_project, name="E2")
+
+        project_ids = await experiment_repository.get_project_ids(
+            [experiment.id, other.id, uuid4()]
+        )
+
+        assert project_ids == {experiment.id: project.id, other.id: other_project.id}
+        assert await experiment_repository.get_project_ids([]) == {}
+
+    async def test_stream_experiment_rows_by_project(
+        self,
+        experiment_repository: ExperimentRepository,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        project = await _create_project(db_session, test_user)
+        other_project = await _create_project(db_session, test_user)
+        await _create_experiment(db_session, project, name="E1")
+        await _create_experiment(db_session, project, name="E2")
+        await _create_experiment(db_session, other_project, name="Other")
+
+        names = {
+            row.name
+            async for row in experiment_repository.stream_experiment_rows_by_project(
+                project.id, batch_size=1
+            )
+        }
+
+        assert names == {"E1", "E2"}
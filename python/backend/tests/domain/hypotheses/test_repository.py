@@ -97,3 +97,28 @@ class TestHypothesisRepository:
         titles = [hypothesis.title for hypothesis in hypotheses]
 
         assert titles == ["Newer", "Older"]
+
+    async def test_stream_hypotheses_by_project_orders_desc(
+        self,
+        hypothesis_repository: HypothesisRepository,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        project = await _create_project(db_session, test_user)
+        other_project = await _create_project(db_session, test_user, name="Other")
+        await _create_hypothesis(
+            db_session, project, title="Older", created_at=datetime(2024, 1, 1)
+        )
+        await _create_hypothesis(
+            db_session, project, title="Newer", created_at=datetime(2024, 1, 2)
+        )
+        await _create_hypothesis(db_session, other_project, title="Other")
+
+        titles = [
+            hypothesis.title
+            async for hypothesis in hypothesis_repository.stream_hypotheses_by_project(
+                project.id
+            )
+        ]
+
+        assert titles == ["Newer", "Older"]
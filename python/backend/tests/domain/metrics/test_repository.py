@@ -101,3 +101,22 @@ class TestMetricRepository:
 
         names = [metric.name for metric in metrics]
         assert names == ["Newer", "Older"]
+
+    async def test_create_many_inserts_all_metrics(
+        self,
+        metric_repository: MetricRepository,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        project = await _create_project(db_session, test_user)
+        experiment = await _create_experiment(db_session, project, name="A")
+        metrics = [
+            MetricModel(experiment_id=experiment.id, name="loss", value=1.0 / step, step=step)
+            for step in range(1, 4)
+        ]
+
+        created = await metric_repository.create_many(metrics)
+
+        assert all(metric.id is not None for metric in created)
+        stored = await metric_repository.get_metrics_by_experiment(experiment.id)
+        assert sorted(metric.step for metric in stored) == [1, 2, 3]
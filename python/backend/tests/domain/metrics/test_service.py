@@ -4,15 +4,29 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from domain.experiments.repository import ExperimentRepository
 from domain.metrics.dto import MetricCreateDTO, MetricUpdateDTO
 from domain.metrics.error import MetricNotAccessibleError, MetricNotFoundError
+from domain.metrics.repository import MetricRepository
 from domain.metrics.service import MetricService
+from domain.projects.repository import ProjectRepository
 from domain.rbac.permissions import ProjectActions
+from domain.rbac.repository import PermissionRepository
 from domain.rbac.service import PermissionService
+from domain.rbac.wrapper import PermissionChecker
 from models import Metric as MetricModel
 from models import MetricDirection, Project, User, Experiment
 
 
+def _permission_service(db_session: AsyncSession) -> PermissionService:
+    return PermissionService(
+        db_session,
+        PermissionRepository(db_session),
+        ProjectRepository(db_session),
+        auto_commit=True,
+    )
+
+
 async def _create_project(
     db_session: AsyncSession,
     owner: User,
@@ -72,7 +86,12 @@ async def _create_metric(
 class TestMetricService:
     @pytest.fixture
     def metric_service(self, db_session: AsyncSession) -> MetricService:
-        return MetricService(db_session)
+        return MetricService(
+            db_session,
+            MetricRepository(db_session),
+            ExperimentRepository(db_session),
+            PermissionChecker(db_session, _permission_service(db_session)),
+        )
 
     async def test_get_metrics_by_experiment_requires_permission(
         self,
@@ -101,7 +120,7 @@ class TestMetricService:
         await _create_metric(
             db_session, experiment, "Newer", created_at=datetime(2024, 1, 2)
         )
-        permission_service = PermissionService(db_session, auto_commit=True)
+        permission_service = _permission_service(db_session)
         await permission_service.add_permission(
             user_id=test_user.id,
             action=ProjectActions.VIEW_METRIC,
@@ -149,7 +168,7 @@ class TestMetricService:
     ) -> None:
         project = await _create_project(db_session, test_user)
         experiment = await _create_experiment(db_session, project, "Experiment")
-        permission_service = PermissionService(db_session, auto_commit=True)
+        permission_service = _permission_service(db_session)
         await permission_service.add_permission(
             user_id=test_user.id,
             action=ProjectActions.CREATE_METRIC,
@@ -196,7 +215,7 @@ class TestMetricService:
         project = await _create_project(db_session, test_user)
         experiment = await _create_experiment(db_session, project, "Experiment")
         metric = await _create_metric(db_session, experiment, "accuracy")
-        permission_service = PermissionService(db_session, auto_commit=True)
+        permission_service = _permission_service(db_session)
         await permission_service.add_permission(
             user_id=test_user.id,
             action=ProjectActions.EDIT_METRIC,
@@ -239,7 +258,7 @@ class TestMetricService:
         project = await _create_project(db_session, test_user)
         experiment = await _create_experiment(db_session, project, "Experiment")
         metric = await _create_metric(db_session, experiment, "accuracy")
-        permission_service = PermissionService(db_session, auto_commit=True)
+        permission_service = _permission_service(db_session)
         await permission_service.add_permission(
             user_id=test_user.id,
             action=ProjectActions.DELETE_METRIC,
@@ -309,7 +328,7 @@ class TestMetricService:
             db_session, experiment, "score", value=0.9, step=2
         )
 
-        permission_service = PermissionService(db_session, auto_commit=True)
+        permission_service = _permission_service(db_session)
         await permission_service.add_permission(
             user_id=test_user.id,
             action=ProjectActions.VIEW_METRIC,
@@ -358,7 +377,7 @@ class TestMetricService:
             db_session, experiment, "average_metric", value=0.4, step=1
         )
 
-        permission_service = PermissionService(db_session, auto_commit=True)
+        permission_service = _permission_service(db_session)
         await permission_service.add_permission(
             user_id=test_user.id,
             action=ProjectActions.VIEW_METRIC,
@@ -376,3 +395,37 @@ class TestMetricService:
             await metric_service.get_aggregated_metrics_for_project(
                 test_user, project.id
             )
+
+    async def test_create_metrics_accepts_string_experiment_ids(
+        self,
+        metric_service: MetricService,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        project = await _create_project(db_session, test_user)
+        experiment = await _create_experiment(db_session, project, "Experiment")
+        permission_service = _permission_service(db_session)
+        await permission_service.add_permission(
+            user_id=test_user.id,
+            action=ProjectActions.CREATE_METRIC,
+            allowed=True,
+            project_id=project.id,
+        )
+        data = [
+            MetricCreateDTO(experiment_id=str(experiment.id), name="loss", value=v)
+            for v in (1.0, 0.5)
+        ]
+
+        created = await metric_service.create_metrics(test_user, data)
+
+        assert [metric.value for metric in created] == [1.0, 0.5]
+
+    async def test_create_metrics_missing_experiment_raises(
+        self,
+        metric_service: MetricService,
+        test_user: User,
+    ) -> None:
+        data = [MetricCreateDTO(experiment_id=str(uuid4()), name="loss", value=1.0)]
+
+        with pytest.raises(MetricNotFoundError):
+            await metric_service.create_metrics(test_user, data)
@@ -1,5 +1,8 @@
+from uuid import uuid4
+
 import pytest
 
+from lib.db.error import DBNotFoundError
 from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -123,3 +126,18 @@ class TestProjectRepository:
         projects = await project_repository.get_projects_by_team(team.id)
         project_ids = {project.id for project in projects}
         assert project_ids == {allowed.id}
+
+    async def test_get_team_id(
+        self,
+        project_repository: ProjectRepository,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        team = await _create_team(db_session, test_user)
+        team_project = await _create_project(db_session, test_user, team=team)
+        personal_project = await _create_project(db_session, test_user, name="Solo")
+
+        assert await project_repository.get_team_id(team_project.id) == team.id
+        assert await project_repository.get_team_id(personal_project.id) is None
+        with pytest.raises(DBNotFoundError):
+            await project_repository.get_team_id(uuid4())
@@ -136,3 +136,56 @@ class TestPermissionRepository:
             test_user.id, actions=TeamActions.VIEW_TEAM
         )
         assert set(results) == {accessible_team.id}
+
+    async def test_get_user_accessible_project_ids_merges_scopes(
+        self,
+        permission_repository: PermissionRepository,
+        db_session: AsyncSession,
+        test_user: User,
+        test_user_2: User,
+    ) -> None:
+        team = await _create_team(db_session, test_user_2)
+        team_project = await _create_project(db_session, test_user_2, team)
+        standalone_project = await _create_project(db_session, test_user_2)
+        denied_project = await _create_project(db_session, test_user_2)
+        other_team = await _create_team(db_session, test_user_2)
+        await _create_project(db_session, test_user_2, other_team)
+
+        for permission in (
+            Permission(
+                user_id=test_user.id,
+                action=TeamActions.VIEW_TEAM,
+                allowed=True,
+                team_id=team.id,
+            ),
+            Permission(
+                user_id=test_user.id,
+                action="project.view",
+                allowed=True,
+                project_id=standalone_project.id,
+            ),
+            Permission(
+                user_id=test_user.id,
+                action="project.view",
+                allowed=False,
+                project_id=denied_project.id,
+            ),
+            Permission(
+                user_id=test_user_2.id,
+                action=TeamActions.VIEW_TEAM,
+                allowed=True,
+                team_id=other_team.id,
+            ),
+        ):
+            await permission_repository.create_permission(permission)
+
+        results = await permission_repository.get_user_accessible_project_ids(
+            test_user.id
+        )
+        assert set(results) == {team_project.id, standalone_project.id}
+        assert (
+            await permission_repository.get_user_accessible_project_ids(
+                test_user.id, actions=TeamActions.MANAGE_TEAM
+            )
+            == []
+        )
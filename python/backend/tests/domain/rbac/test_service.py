@@ -11,6 +11,8 @@ from domain.rbac.permissions.project import (
     role_to_project_permissions,
 )
 from domain.rbac.permissions.team import TeamActions, role_to_team_permissions
+from domain.projects.repository import ProjectRepository
+from domain.rbac.repository import PermissionRepository
 from domain.rbac.service import PermissionService
 from models import Project, Team, Role, User
 
@@ -412,3 +414,104 @@ class TestPermissionService:
             missing_user_id
         )
         assert accessible_teams == []
+
+
+class TestPermissionServiceTeamIdsCache:
+    async def test_team_ids_are_reused_until_team_permissions_change(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        repository = PermissionRepository(db_session)
+        permission_service = PermissionService(
+            db_session, repository, ProjectRepository(db_session)
+        )
+        team = await _create_team(db_session, test_user)
+        calls = 0
+        get_team_ids = repository.get_user_accessible_teams_ids
+
+        async def counting_get_team_ids(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return await get_team_ids(*args, **kwargs)
+
+        repository.get_user_accessible_teams_ids = counting_get_team_ids
+
+        assert await permission_service.get_user_accessible_team_ids(test_user.id) == []
+        assert await permission_service.get_user_accessible_team_ids(test_user.id) == []
+        assert calls == 1
+
+        await permission_service.add_user_to_team_permissions(
+            test_user.id, team.id, Role.VIEWER
+        )
+
+        assert await permission_service.get_user_accessible_team_ids(test_user.id) == [
+            team.id
+        ]
+        assert calls == 2
+
+    async def test_verdicts_are_reused_until_permissions_change(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        repository = PermissionRepository(db_session)
+        permission_service = PermissionService(
+            db_session, repository, ProjectRepository(db_session)
+        )
+        team = await _create_team(db_session, test_user)
+        calls = 0
+        get_permissions = repository.get_permissions
+
+        async def counting_get_permissions(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return await get_permissions(*args, **kwargs)
+
+        repository.get_permissions = counting_get_permissions
+
+        for _ in range(2):
+            assert not await permission_service.has_permission(
+                test_user.id, TeamActions.VIEW_TEAM, team_id=team.id
+            )
+        assert calls == 1
+
+        await permission_service.add_user_to_team_permissions(
+            test_user.id, team.id, Role.VIEWER
+        )
+        calls = 0
+
+        assert await permission_service.has_permission(
+            test_user.id, TeamActions.VIEW_TEAM, team_id=team.id
+        )
+        assert calls == 1
+
+    async def test_accessible_project_ids_are_reused_until_permissions_change(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        repository = PermissionRepository(db_session)
+        permission_service = PermissionService(
+            db_session, repository, ProjectRepository(db_session)
+        )
+        team = await _create_team(db_session, test_user)
+        project = await _create_project(db_session, test_user, team, "Cached")
+        calls = 0
+        get_project_ids = repository.get_user_accessible_project_ids
+
+        async def counting_get_project_ids(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return await get_project_ids(*args, **kwargs)
+
+        repository.get_user_accessible_project_ids = counting_get_project_ids
+
+        for _ in range(2):
+            assert await permission_service.get_user_accessible_project_ids(
+                test_user.id
+            ) == []
+        assert calls == 1
+
+        await permission_service.add_user_to_team_permissions(
+            test_user.id, team.id, Role.VIEWER
+        )
+
+        assert await permission_service.get_user_accessible_project_ids(
+            test_user.id
+        ) == [project.id]
+        assert calls == 2
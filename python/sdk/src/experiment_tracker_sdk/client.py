@@ -17,6 +17,7 @@ from .models import (
     LastLoggedExperimentsRequest,
     LastLoggedExperimentsResponse,
     MetricCreateRequest,
+    ScalarBatchLogRequest,
     ScalarLogRequest,
 )
 from .queue import RequestItem, RequestQueue
@@ -49,6 +50,7 @@ class ExperimentClient:
         api_token: str,
         timeout: float = 10.0,
         max_queue_size: int = 1000,
+        client: Optional[httpx.Client] = None,
     ):
         """Initialize a synchronous SDK client for Experiment Tracker.
 
@@ -57,6 +59,9 @@ class ExperimentClient:
             api_token: API token used for Authorization header.
             timeout: HTTP timeout (seconds) for requests.
             max_queue_size: Max queued metric requests before blocking.
+            client: Optional pre-configured httpx client to reuse its
+                connection pool. It must already carry the base URL and
+                Authorization header, and is not closed by ``close()``.
 
         Example:
             client = ExperimentClient(
@@ -66,7 +71,8 @@ class ExperimentClient:
         """
         self.base_url = base_url.rstrip("/")
         self.api_token = api_token
-        self._client = httpx.Client(
+        self._owns_client = client is None
+        self._client = client or httpx.Client(
             base_url=self.base_url,
             timeout=timeout,
             headers={"Authorization": f"Bearer {api_token}"},
@@ -282,6 +288,34 @@ class ExperimentClient:
             )
         )
 
+    def log_scalars_batch(
+        self,
+        experiment_id: str,
+        rows: list[ScalarLogRequest],
+    ) -> None:
+        """Enqueue a single request carrying scalar values for several steps.
+
+        Args:
+            experiment_id: Experiment UUID string.
+            rows: Scalar rows, one per step.
+
+        Example:
+            client.log_scalars_batch(
+                exp.id,
+                [ScalarLogRequest(scalars={"loss": 0.4}, step=1)],
+            )
+        """
+        if not rows:
+            return
+        payload = ScalarBatchLogRequest(scalars=rows)
+        self._queue.enqueue(
+            RequestItem(
+                method="POST",
+                path=f"/api/scalars/log_batch/{experiment_id}",
+                json=payload.model_dump(exclude_none=True),
+            )
+        )
+
     def get_scalars(
         self,
         experiment_id: str,
@@ -368,6 +402,7 @@ class ExperimentClient:
         self._queue.flush()
 
     def close(self) -> None:
-        """Close the request queue and underlying HTTP client."""
+        """Close the request queue and the HTTP client if this instance owns it."""
         self._queue.close()
-        self._client.close()
+        if self._owns_client:
+            self._client.close()
@@ -56,6 +56,10 @@ class ScalarLogRequest(BaseModel):
     tags: list[str] | None = None
 
 
+class ScalarBatchLogRequest(BaseModel):
+    scalars: list[ScalarLogRequest]
+
+
 class LastLoggedExperimentsRequest(BaseModel):
     experiment_ids: list[str] | None = None
 
@@ -0,0 +1,33 @@
+import httpx
+
+from experiment_tracker_sdk import ExperimentClient
+from experiment_tracker_sdk.models import ScalarLogRequest
+
+
+def test_client_reuses_injected_http_client():
+    received = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        return httpx.Response(200, json={"status": "ok"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(base_url="http://test", transport=transport)
+    client = ExperimentClient(
+        base_url="http://test", api_token="token", client=http_client
+    )
+
+    client.log_scalars_batch(
+        "exp-1",
+        [
+            ScalarLogRequest(scalars={"loss": 0.5}, step=1),
+            ScalarLogRequest(scalars={"loss": 0.4}, step=2),
+        ],
+    )
+    client.flush()
+    client.close()
+
+    assert len(received) == 1
+    assert received[0].url.path == "/api/scalars/log_batch/exp-1"
+    assert not http_client.is_closed
+    http_client.close()